@@ -8,75 +8,171 @@ import socket
 import time
 import json
 from datetime import datetime
-import platform
 import glob
+import os
 
 # Configuration
 ESP32_IP = "192.168.1.197"  # Change to your ESP32 IP address
 UDP_PORT = 4210
 BROADCAST_INTERVAL = 3  # Increased to 3 seconds for even less CPU usage
 
-def get_linux_temperatures():
-    """Get CPU and GPU temperatures and fan speed on Linux using psutil"""
-    cpu_temp = None
-    gpu_temp = None
-    fan_speed = None
+# Persistent /proc file descriptors, reused every tick (path -> fd)
+_proc_fds = {}
+
+# Previous (busy, total) jiffies from /proc/stat for the CPU% delta
+_cpu_prev = None
+
+# Substrings used to classify psutil sensor keys/labels (matched lowercase)
+_CPU_KEY_HINTS = frozenset(('coretemp', 'k10temp', 'cpu'))
+_CPU_LABEL_HINTS = frozenset(('package', 'tctl'))
+_GPU_KEY_HINTS = frozenset(('nvidia', 'gpu'))
+
+# (key, index) of the chosen entries, resolved once by _resolve_sensor_sources()
+_sensor_sources = None
+
+
+def _resolve_sensor_sources():
+    """
+    Classify psutil sensor keys once and remember where each value lives.
+    Returns dict with 'cpu', 'gpu', 'fan' -> (key, index) or None.
+    """
+    sources = {"cpu": None, "gpu": None, "fan": None}
 
-    # --- 1. Get Temperatures (CPU/GPU) ---
     if hasattr(psutil, "sensors_temperatures"):
         temps = psutil.sensors_temperatures()
-        
-        # CPU Temp Logic
-        for key in temps:
-            # Look for common CPU keys like 'coretemp', 'k10temp', 'cpu-thermal'
-            if "coretemp" in key.lower() or "k10temp" in key.lower() or "cpu" in key.lower():
-                for entry in temps[key]:
-                    # Often the 'Package id 0' or 'Tctl' label has the main reading
-                    if "package" in entry.label.lower() or "tctl" in entry.label.lower() or entry.label == "":
-                        cpu_temp = int(entry.current)
+
+        # CPU: common keys like 'coretemp', 'k10temp', 'cpu-thermal';
+        # the 'Package id 0' or 'Tctl' label (or an unlabeled entry) has the main reading
+        for key, entries in temps.items():
+            key_lower = key.lower()
+            if any(h in key_lower for h in _CPU_KEY_HINTS):
+                for idx, entry in enumerate(entries):
+                    label_lower = entry.label.lower()
+                    if not label_lower or any(h in label_lower for h in _CPU_LABEL_HINTS):
+                        sources["cpu"] = (key, idx)
                         break
-                if cpu_temp is not None:
+                if sources["cpu"] is not None:
                     break
 
-        # GPU Temp Logic (NVIDIA via psutil if available)
-        for key in temps:
-            if "nvidia" in key.lower() or "gpu" in key.lower():
-                for entry in temps[key]:
-                    gpu_temp = int(entry.current)
-                    break
-                if gpu_temp is not None:
-                    break
-                    
-    # --- 2. Get Fan Speed ---
+        # GPU (NVIDIA via psutil if available): first entry of the first match
+        for key, entries in temps.items():
+            key_lower = key.lower()
+            if entries and any(h in key_lower for h in _GPU_KEY_HINTS):
+                sources["gpu"] = (key, 0)
+                break
+
+    # Fan: first key with a detected speed (usually "fan1_input" or similar)
     if hasattr(psutil, "sensors_fans"):
-        fans = psutil.sensors_fans()
-        for key in fans:
-            # Iterate through all fan entries and pick the first detected speed
-            if fans[key]:
-                # This usually picks up "fan1_input" or similar from the system
-                fan_speed = int(fans[key][0].current)
+        for key, entries in psutil.sensors_fans().items():
+            if entries:
+                sources["fan"] = (key, 0)
                 break
-    
+
+    return sources
+
+
+def get_linux_temperatures():
+    """Get CPU and GPU temperatures and fan speed on Linux using psutil"""
+    global _sensor_sources
+
+    if _sensor_sources is None:
+        _sensor_sources = _resolve_sensor_sources()
+
+    cpu_temp = None
+    gpu_temp = None
+    fan_speed = None
+
+    try:
+        cpu_src = _sensor_sources["cpu"]
+        gpu_src = _sensor_sources["gpu"]
+        if cpu_src or gpu_src:
+            temps = psutil.sensors_temperatures()
+            if cpu_src:
+                cpu_temp = int(temps[cpu_src[0]][cpu_src[1]].current)
+            if gpu_src:
+                gpu_temp = int(temps[gpu_src[0]][gpu_src[1]].current)
+
+        fan_src = _sensor_sources["fan"]
+        if fan_src:
+            fan_speed = int(psutil.sensors_fans()[fan_src[0]][fan_src[1]].current)
+    except (KeyError, IndexError):
+        # Sensor layout changed (driver reload, hotplug) - re-resolve next tick
+        _sensor_sources = None
+
     return fan_speed, cpu_temp, gpu_temp
 
-def get_sensor_values():
-    """Get sensor values for Linux (CPU temp, GPU temp, fan speed)"""
-    if platform.system() == "Linux":
-        return get_linux_temperatures()
-    else:
-        # Not supported
-        return None, None, None
+def _read_proc(path):
+    """Read a whole /proc file through a cached fd (rewound, not reopened)"""
+    fd = _proc_fds.get(path)
+    if fd is None:
+        fd = os.open(path, os.O_RDONLY)
+        _proc_fds[path] = fd
+    os.lseek(fd, 0, os.SEEK_SET)
+    chunks = []
+    while True:
+        chunk = os.read(fd, 8192)
+        if not chunk:
+            break
+        chunks.append(chunk)
+    return b"".join(chunks)
+
+
+def _sweep():
+    """
+    Read CPU, RAM, disk and sensors in one pass.
+    Returns a flat tuple:
+    (cpu_pct, ram_pct, ram_used_gb, ram_total_gb, disk_pct, fan, cpu_temp, gpu_temp)
+    """
+    global _cpu_prev
+
+    # CPU: aggregate line of /proc/stat (user nice system idle iowait irq softirq steal ...)
+    stat = _read_proc("/proc/stat")
+    fields = [int(x) for x in stat[:stat.index(b"\n")].split()[1:9]]
+    total = sum(fields)
+    busy = total - fields[3] - fields[4]
+    cpu_pct = 0.0
+    if _cpu_prev is not None:
+        total_delta = total - _cpu_prev[1]
+        if total_delta > 0:
+            cpu_pct = (busy - _cpu_prev[0]) * 100.0 / total_delta
+    _cpu_prev = (busy, total)
+
+    # RAM: /proc/meminfo values are in kB
+    meminfo = {}
+    for line in _read_proc("/proc/meminfo").split(b"\n"):
+        key, _, rest = line.partition(b":")
+        if key in (b"MemTotal", b"MemAvailable"):
+            meminfo[key] = int(rest.split()[0]) * 1024
+            if len(meminfo) == 2:
+                break
+    mem_total = meminfo[b"MemTotal"]
+    mem_used = mem_total - meminfo[b"MemAvailable"]
+    ram_pct = mem_used * 100.0 / mem_total if mem_total else 0.0
+
+    # Disk: same formula as psutil.disk_usage('/').percent
+    st = os.statvfs('/')
+    disk_used = (st.f_blocks - st.f_bfree) * st.f_frsize
+    disk_avail = st.f_bavail * st.f_frsize
+    disk_total_user = disk_used + disk_avail
+    disk_pct = disk_used * 100.0 / disk_total_user if disk_total_user else 0.0
+
+    fan_speed, cpu_temp, gpu_temp = get_linux_temperatures()
+
+    return (cpu_pct, ram_pct, mem_used / (1024**3), mem_total / (1024**3),
+            disk_pct, fan_speed, cpu_temp, gpu_temp)
+
 
 def get_system_stats():
     """Collect system statistics (Linux compatible)"""
-    fan_speed, cpu_temp, gpu_temp = get_sensor_values()
+    (cpu_pct, ram_pct, ram_used_gb, ram_total_gb,
+     disk_pct, fan_speed, cpu_temp, gpu_temp) = _sweep()
     stats = {
         'timestamp': datetime.now().strftime('%H:%M'),
-        'cpu_percent': round(psutil.cpu_percent(interval=0), 1),
-        'ram_percent': round(psutil.virtual_memory().percent, 1),
-        'ram_used_gb': round(psutil.virtual_memory().used / (1024**3), 1),
-        'ram_total_gb': round(psutil.virtual_memory().total / (1024**3), 1),
-        'disk_percent': round(psutil.disk_usage('/').percent, 1),
+        'cpu_percent': round(cpu_pct, 1),
+        'ram_percent': round(ram_pct, 1),
+        'ram_used_gb': round(ram_used_gb, 1),
+        'ram_total_gb': round(ram_total_gb, 1),
+        'disk_percent': round(disk_pct, 1),
         'cpu_temp': cpu_temp,
         'gpu_temp': gpu_temp,
         'fan_speed': fan_speed,
@@ -106,8 +202,9 @@ def main():
 
     sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
 
-    # Initial CPU reading to warm up psutil
-    psutil.cpu_percent(interval=1)
+    # Initial CPU reading so the first tick has a delta to work from
+    _sweep()
+    time.sleep(1)
 
     try:
         while True:
@@ -5,7 +5,8 @@ System monitoring for macOS with ESP32 OLED display support.
 
 Features:
 - psutil-based system metrics (CPU, RAM, Disk, Network)
-- ioreg-based hardware sensors (temperature, fans - hardware dependent)
+- IOKit-based hardware sensors (temperature, fans - hardware dependent),
+  with an ioreg fallback
 - Tkinter GUI for configuration with custom labels
 - rumps menu bar integration for background operation
 - Auto-detach from terminal when running minimized
@@ -33,6 +34,8 @@ Hardware Compatibility:
 """
 
 import psutil
+import asyncio
+import array
 import socket
 import time
 import json
@@ -41,18 +44,48 @@ import sys
 import argparse
 import subprocess
 import platform
-from datetime import datetime
-import tkinter as tk
-from tkinter import ttk, messagebox
+import ctypes
+import functools
 import re
 
-# Try to import rumps for menu bar support
+# tkinter and rumps are imported on first use (see _ensure_tk / _ensure_rumps)
+# so CLI-only paths such as --autostart never load Tcl/Tk or AppKit
+tk = None
+ttk = None
+messagebox = None
+rumps = None
+RUMPS_AVAILABLE = None  # None = not tried yet
+
+# Optional faster JSON for config load/save (falls back to stdlib json)
 try:
-    import rumps
-    RUMPS_AVAILABLE = True
+    import orjson
+    ORJSON_AVAILABLE = True
 except ImportError:
-    RUMPS_AVAILABLE = False
-    print("Note: rumps not available. Install with: pip3 install rumps")
+    ORJSON_AVAILABLE = False
+
+
+def _ensure_tk():
+    """Import tkinter on first use and bind tk/ttk/messagebox globals"""
+    global tk, ttk, messagebox
+    if tk is None:
+        import tkinter
+        from tkinter import ttk as _ttk, messagebox as _messagebox
+        tk, ttk, messagebox = tkinter, _ttk, _messagebox
+    return tk
+
+
+def _ensure_rumps():
+    """Try to import rumps for menu bar support; returns True if available"""
+    global rumps, RUMPS_AVAILABLE
+    if RUMPS_AVAILABLE is None:
+        try:
+            import rumps as _rumps
+            rumps = _rumps
+            RUMPS_AVAILABLE = True
+        except ImportError:
+            RUMPS_AVAILABLE = False
+    return RUMPS_AVAILABLE
+
 
 # Configuration file path
 CONFIG_FILE = "monitor_config_macos.json"
@@ -69,6 +102,15 @@ DEFAULT_CONFIG = {
 # Maximum metrics supported by ESP32
 MAX_METRICS = 20
 
+# Disk usage changes slowly - re-read statfs at most this often (seconds)
+DISK_USAGE_TTL = 30
+
+# Minimum interval between CPU / memory reads (seconds); faster callers
+# get the previous sample
+PSUTIL_MIN_INTERVAL = 0.25
+_cpu_cache = {"t": 0.0, "v": None}
+_vm_cache = {"t": 0.0, "v": None}
+
 # Global sensor database
 sensor_database = {
     "system": [],    # psutil-based metrics (CPU%, RAM%, Disk%)
@@ -81,8 +123,47 @@ sensor_database = {
 }
 
 # Global variables for network stats (for throughput calculation)
-_network_stats_prev = {}
-_network_stats_time = None
+_prev_sent = 0
+_prev_recv = 0
+_prev_time = None
+
+# Calls closer together than this share one result - a near-zero delta
+# would report bogus throughput
+NET_STATS_MIN_INTERVAL = 0.2
+_net_stats = None
+
+# In-process IOKit sensor reader (None = not tried yet, False = unavailable)
+_iokit_reader = None
+
+# Persistent UDP socket shared by all send loops (created on first use)
+UDP_SNDBUF = 1 << 20
+SO_NOSIGPIPE = getattr(socket, "SO_NOSIGPIPE", 0x1022)  # Darwin value
+_udp_sock = None
+
+# Unchanged payloads are not re-sent, except as a heartbeat this often
+# (seconds) - well inside the ESP32's 10 s "no data" timeout
+HEARTBEAT_INTERVAL = 5
+
+# Payload timestamp only changes once a minute - format it once per minute
+_ts_cache = {"minute": None, "str": ""}
+
+# Temperatures/fans change slowly - reuse a sensor read for this many seconds
+IOREG_CACHE_TTL = 5
+
+# ioreg text parsing (fallback path) - compiled once
+# Typical keys: "temperature", "TC0D", "TCXC", "CPU", "GPU"
+_TEMP_RE = re.compile(
+    r'"([^"]*)"\s*=\s*<{[^}]*"type"\s*=\s*"temperature"[^}]*"location"\s*=\s*"([^"]*)"[^}]*"current-value"\s*=\s*(\d+)')
+# Line-based fallback: first 4-5 digit run on a temperature line, or
+# first 3-5 digit run on a fan line (typical fan keys: "fan", "F0Ac", "F1Ac")
+_FALLBACK_RE = re.compile(
+    r'^(?:(?=[^\n]*(?:(?i:"temperature")|TC0D|TCXC))[^\n]*?(?P<temp>\d{4,5})'
+    r'|(?=[^\n]*(?i:"fan"|"fan speed"))[^\n]*?(?P<fan>\d{3,5}))',
+    re.MULTILINE)
+# Same fan alternative alone, for when the structured pattern found temperatures
+_FAN_LINE_RE = re.compile(
+    r'^(?=[^\n]*(?i:"fan"|"fan speed"))[^\n]*?(?P<fan>\d{3,5})',
+    re.MULTILINE)
 
 # Detect hardware type
 def detect_hardware_type():
@@ -109,11 +190,264 @@ def get_macos_version():
     return platform.mac_ver()[0]
 
 
+class IOKitSensorReader:
+    """
+    Reads IOHWSensor entries directly from the IOKit registry via ctypes.
+    Same data as `ioreg -rn IOHWSensor`, without forking a process or
+    parsing its text output.
+    """
+    IOKIT_PATH = "/System/Library/Frameworks/IOKit.framework/IOKit"
+    CF_PATH = "/System/Library/Frameworks/CoreFoundation.framework/CoreFoundation"
+    kIOMasterPortDefault = 0
+    kCFNumberSInt32Type = 3
+    kCFStringEncodingUTF8 = 0x08000100
+
+    def __init__(self):
+        iokit = ctypes.CDLL(self.IOKIT_PATH)
+        cf = ctypes.CDLL(self.CF_PATH)
+
+        iokit.IOServiceMatching.restype = ctypes.c_void_p
+        iokit.IOServiceMatching.argtypes = [ctypes.c_char_p]
+        iokit.IOServiceGetMatchingServices.restype = ctypes.c_int
+        iokit.IOServiceGetMatchingServices.argtypes = [
+            ctypes.c_uint, ctypes.c_void_p, ctypes.POINTER(ctypes.c_uint)]
+        iokit.IOIteratorNext.restype = ctypes.c_uint
+        iokit.IOIteratorNext.argtypes = [ctypes.c_uint]
+        iokit.IORegistryEntryCreateCFProperties.restype = ctypes.c_int
+        iokit.IORegistryEntryCreateCFProperties.argtypes = [
+            ctypes.c_uint, ctypes.POINTER(ctypes.c_void_p), ctypes.c_void_p, ctypes.c_uint]
+        iokit.IOObjectRelease.restype = ctypes.c_int
+        iokit.IOObjectRelease.argtypes = [ctypes.c_uint]
+
+        cf.CFStringCreateWithCString.restype = ctypes.c_void_p
+        cf.CFStringCreateWithCString.argtypes = [ctypes.c_void_p, ctypes.c_char_p, ctypes.c_uint32]
+        cf.CFDictionaryGetValue.restype = ctypes.c_void_p
+        cf.CFDictionaryGetValue.argtypes = [ctypes.c_void_p, ctypes.c_void_p]
+        cf.CFGetTypeID.restype = ctypes.c_ulong
+        cf.CFGetTypeID.argtypes = [ctypes.c_void_p]
+        cf.CFNumberGetTypeID.restype = ctypes.c_ulong
+        cf.CFStringGetTypeID.restype = ctypes.c_ulong
+        cf.CFNumberGetValue.restype = ctypes.c_bool
+        cf.CFNumberGetValue.argtypes = [ctypes.c_void_p, ctypes.c_int, ctypes.c_void_p]
+        cf.CFStringGetCString.restype = ctypes.c_bool
+        cf.CFStringGetCString.argtypes = [ctypes.c_void_p, ctypes.c_char_p, ctypes.c_long, ctypes.c_uint32]
+        cf.CFRetain.restype = ctypes.c_void_p
+        cf.CFRetain.argtypes = [ctypes.c_void_p]
+        cf.CFRelease.restype = None
+        cf.CFRelease.argtypes = [ctypes.c_void_p]
+
+        self.iokit = iokit
+        self.cf = cf
+        self.number_type_id = cf.CFNumberGetTypeID()
+        self.string_type_id = cf.CFStringGetTypeID()
+
+        # Built once; IOServiceGetMatchingServices consumes a reference per call
+        self.matching = iokit.IOServiceMatching(b"IOHWSensor")
+        if not self.matching:
+            raise OSError("IOServiceMatching(IOHWSensor) failed")
+
+        self.key_value = self._cfstr(b"current-value")
+        self.key_type = self._cfstr(b"type")
+        self.key_location = self._cfstr(b"location")
+
+    def _cfstr(self, value):
+        return self.cf.CFStringCreateWithCString(None, value, self.kCFStringEncodingUTF8)
+
+    def _get_string(self, props, key):
+        ref = self.cf.CFDictionaryGetValue(props, key)
+        if not ref or self.cf.CFGetTypeID(ref) != self.string_type_id:
+            return ""
+        buf = ctypes.create_string_buffer(128)
+        if not self.cf.CFStringGetCString(ref, buf, len(buf), self.kCFStringEncodingUTF8):
+            return ""
+        return buf.value.decode("utf-8", "replace")
+
+    def _get_int(self, props, key):
+        ref = self.cf.CFDictionaryGetValue(props, key)
+        if not ref or self.cf.CFGetTypeID(ref) != self.number_type_id:
+            return None
+        value = ctypes.c_int32()
+        if not self.cf.CFNumberGetValue(ref, self.kCFNumberSInt32Type, ctypes.byref(value)):
+            return None
+        return value.value
+
+    def read(self):
+        """Returns: dict with temperature and fan sensors (same shape as get_ioreg_sensors)"""
+        sensors = {
+            "temperatures": [],
+            "fans": []
+        }
+
+        iterator = ctypes.c_uint(0)
+        self.cf.CFRetain(self.matching)
+        if self.iokit.IOServiceGetMatchingServices(
+                self.kIOMasterPortDefault, self.matching, ctypes.byref(iterator)) != 0:
+            return sensors
+
+        try:
+            while True:
+                entry = self.iokit.IOIteratorNext(iterator.value)
+                if not entry:
+                    break
+                props = ctypes.c_void_p()
+                try:
+                    if self.iokit.IORegistryEntryCreateCFProperties(
+                            entry, ctypes.byref(props), None, 0) != 0 or not props.value:
+                        continue
+                    try:
+                        self._add_sensor(props.value, sensors)
+                    finally:
+                        self.cf.CFRelease(props.value)
+                finally:
+                    self.iokit.IOObjectRelease(entry)
+        finally:
+            self.iokit.IOObjectRelease(iterator.value)
+
+        return sensors
+
+    def _add_sensor(self, props, sensors):
+        raw_value = self._get_int(props, self.key_value)
+        if raw_value is None:
+            return
+        sensor_type = self._get_string(props, self.key_type).lower()
+        location = self._get_string(props, self.key_location)
+
+        if sensor_type == "temperature":
+            # Hundredths of degree Celsius, as in the ioreg text output
+            sensors["temperatures"].append({
+                "name": location or "CPU",
+                "value": raw_value / 100.0
+            })
+        elif "fan" in sensor_type:
+            if 100 < raw_value < 10000:  # Valid RPM range
+                sensors["fans"].append({
+                    "name": location or "FAN",
+                    "value": raw_value
+                })
+
+
+class IoregCache:
+    """
+    Latest hardware sensor read in columnar form: parallel names / values /
+    kinds plus a (kind, lowercased name) -> position index. refresh()
+    re-reads at most every ttl seconds and updates the columns in place.
+    """
+    KINDS = ("temperatures", "fans")
+
+    def __init__(self, ttl=IOREG_CACHE_TTL):
+        self.ttl = ttl
+        self.ts = None
+        self._proc = None  # ioreg command started by begin_refresh()
+        self.names = []
+        self.values = array.array('d')
+        self.kinds = bytearray()
+        self.index = {}
+
+    def _stale(self):
+        return self.ts is None or time.monotonic() - self.ts >= self.ttl
+
+    def begin_refresh(self):
+        """
+        If a refresh is due and sensors come from the ioreg command, launch
+        it now so it runs while the caller does other work; refresh()
+        collects its output
+        """
+        if self._proc is None and _iokit_reader is False and self._stale():
+            try:
+                self._proc = _start_ioreg()
+            except OSError:
+                self._proc = None
+
+    def refresh(self):
+        """Re-read sensors if the last read is older than ttl"""
+        if self._stale():
+            self.ts = time.monotonic()
+            proc, self._proc = self._proc, None
+            self.load(_read_ioreg_sensors(proc))
+
+    def load(self, sensors):
+        """Store a {"temperatures": [...], "fans": [...]} sensor read"""
+        names = []
+        values = []
+        kinds = bytearray()
+        for code, kind in enumerate(self.KINDS):
+            for sensor in sensors[kind]:
+                names.append(sensor["name"])
+                values.append(sensor["value"])
+                kinds.append(code)
+
+        if names == self.names and kinds == self.kinds:
+            # Same sensors as last time - only the readings change
+            for i, value in enumerate(values):
+                self.values[i] = value
+            return
+
+        self.names = names
+        self.values = array.array('d', values)
+        self.kinds = kinds
+        self.index = {}
+        for i, name in enumerate(names):
+            self.index.setdefault((self.KINDS[kinds[i]], name.lower()), i)
+
+    def get(self, kind, name_lower):
+        """Value of the sensor of kind with this lowercased name, or None"""
+        i = self.index.get((kind, name_lower))
+        return None if i is None else self.values[i]
+
+    def sensors(self, kind):
+        """(name, value) pairs of one kind, in read order"""
+        code = self.KINDS.index(kind)
+        return [(name, self.values[i]) for i, name in enumerate(self.names)
+                if self.kinds[i] == code]
+
+    def as_dict(self):
+        """Sensors as {"temperatures": [{"name", "value"}], "fans": [...]}"""
+        return {kind: [{"name": name, "value": value} for name, value in self.sensors(kind)]
+                for kind in self.KINDS}
+
+
+_ioreg_cache = IoregCache()
+
+
 def get_ioreg_sensors():
     """
-    Get hardware sensors via ioreg command
+    Get hardware sensors, reusing the last read for IOREG_CACHE_TTL seconds
+    Returns: dict with temperature and fan sensors
+    """
+    _ioreg_cache.refresh()
+    return _ioreg_cache.as_dict()
+
+
+def _start_ioreg():
+    """Launch the ioreg command (fallback sensor source) without waiting for it"""
+    return subprocess.Popen(
+        ['ioreg', '-rn', 'IOHWSensor'],
+        stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, text=True
+    )
+
+
+def _read_ioreg_sensors(proc=None):
+    """
+    Read hardware sensors via IOKit (falls back to the ioreg command)
+    proc: ioreg command already started with _start_ioreg(), if any
     Returns: dict with temperature and fan sensors
     """
+    global _iokit_reader
+
+    if proc is None:
+        if _iokit_reader is None:
+            try:
+                _iokit_reader = IOKitSensorReader()
+            except (OSError, AttributeError):
+                _iokit_reader = False
+
+        if _iokit_reader:
+            try:
+                return _iokit_reader.read()
+            except Exception as e:
+                print(f"Note: IOKit sensor read failed, using ioreg: {e}")
+                _iokit_reader = False
+
     sensors = {
         "temperatures": [],
         "fans": []
@@ -121,17 +455,17 @@ def get_ioreg_sensors():
 
     try:
         # Try to get sensor data from ioreg
-        result = subprocess.run(
-            ['ioreg', '-rn', 'IOHWSensor'],
-            capture_output=True, text=True, timeout=5
-        )
-
-        output = result.stdout
+        if proc is None:
+            proc = _start_ioreg()
+        try:
+            output, _ = proc.communicate(timeout=5)
+        except subprocess.TimeoutExpired:
+            proc.kill()
+            proc.communicate()
+            raise
 
         # Parse temperature sensors
-        # Typical keys: "temperature", "TC0D", "TCXC", "CPU", "GPU"
-        temp_pattern = r'"([^"]*)"\s*=\s*<{[^}]*"type"\s*=\s*"temperature"[^}]*"location"\s*=\s*"([^"]*)"[^}]*"current-value"\s*=\s*(\d+)'
-        for match in re.finditer(temp_pattern, output):
+        for match in _TEMP_RE.finditer(output):
             sensor_name = match.group(2)
             raw_value = int(match.group(3))
             # Convert from hundredths of degree Celsius to degrees
@@ -141,36 +475,35 @@ def get_ioreg_sensors():
                 "value": temp_c
             })
 
-        # Alternative parsing for different ioreg formats
-        lines = output.split('\n')
-        for line in lines:
-            # Look for temperature keys
-            if '"temperature"' in line.lower() or 'TC0D' in line or 'TCXC' in line:
-                # Try to extract numeric value
-                temp_match = re.search(r'(\d{4,5})', line)
-                if temp_match:
-                    temp_val = int(temp_match.group(1))
+        # Alternative parsing for different ioreg formats - one scan over
+        # the text finds the first temperature line and the first fan line.
+        # When the structured pattern already produced temperatures, only
+        # fan lines are looked for.
+        temp_found = bool(sensors["temperatures"])
+        fan_found = False
+        fallback_re = _FAN_LINE_RE if temp_found else _FALLBACK_RE
+        for match in fallback_re.finditer(output):
+            if match.lastgroup == "temp":
+                if not temp_found:
+                    temp_val = int(match.group("temp"))
                     if temp_val > 1000:  # Likely in hundredths
                         temp_val = temp_val / 100.0
                     sensors["temperatures"].append({
                         "name": "CPU",
                         "value": temp_val
                     })
-                    break  # Use first temperature found
-
-        # Parse fan sensors
-        # Typical keys: "fan", "F0Ac", "F1Ac"
-        for line in lines:
-            if '"fan"' in line.lower() or '"fan speed"' in line.lower():
-                fan_match = re.search(r'(\d{3,5})', line)
-                if fan_match:
-                    fan_rpm = int(fan_match.group(1))
-                    if 100 < fan_rpm < 10000:  # Valid RPM range
-                        sensors["fans"].append({
-                            "name": "FAN",
-                            "value": fan_rpm
-                        })
-                        break  # Use first fan found
+                    temp_found = True  # Use first temperature found
+            elif not fan_found:
+                fan_rpm = int(match.group("fan"))
+                if 100 < fan_rpm < 10000:  # Valid RPM range
+                    sensors["fans"].append({
+                        "name": "FAN",
+                        "value": fan_rpm
+                    })
+                    fan_found = True  # Use first fan found
+
+            if temp_found and fan_found:
+                break
 
     except (subprocess.TimeoutExpired, subprocess.SubprocessError, FileNotFoundError):
         pass
@@ -180,43 +513,70 @@ def get_ioreg_sensors():
     return sensors
 
 
+@functools.lru_cache(maxsize=1)
+def _disk_usage_for_period(period):
+    """Cached psutil.disk_usage('/') for one DISK_USAGE_TTL period"""
+    return psutil.disk_usage('/')
+
+
+def get_disk_usage():
+    """Root partition usage, refreshed every DISK_USAGE_TTL seconds"""
+    return _disk_usage_for_period(int(time.monotonic() // DISK_USAGE_TTL))
+
+
+def cached_cpu_percent(min_dt=PSUTIL_MIN_INTERVAL):
+    """psutil.cpu_percent(interval=0), re-read at most every min_dt seconds"""
+    now = time.monotonic()
+    if _cpu_cache["v"] is None or now - _cpu_cache["t"] >= min_dt:
+        _cpu_cache["v"] = psutil.cpu_percent(interval=0)
+        _cpu_cache["t"] = now
+    return _cpu_cache["v"]
+
+
+def cached_virtual_memory(min_dt=PSUTIL_MIN_INTERVAL):
+    """psutil.virtual_memory(), re-read at most every min_dt seconds"""
+    now = time.monotonic()
+    if _vm_cache["v"] is None or now - _vm_cache["t"] >= min_dt:
+        _vm_cache["v"] = psutil.virtual_memory()
+        _vm_cache["t"] = now
+    return _vm_cache["v"]
+
+
 def get_network_stats():
     """
     Get network statistics for throughput and data tracking
     Returns: dict with upload/download speeds and total data
     """
-    global _network_stats_prev, _network_stats_time
+    global _prev_sent, _prev_recv, _prev_time, _net_stats
+
+    current_time = time.monotonic()
+    if _net_stats is not None and current_time - _prev_time < NET_STATS_MIN_INTERVAL:
+        return _net_stats
 
     net_io = psutil.net_io_counters()
-    current_time = time.time()
+    bytes_sent = net_io.bytes_sent
+    bytes_recv = net_io.bytes_recv
 
     stats = {
         "upload_speed_bps": 0,
         "download_speed_bps": 0,
-        "total_upload_gb": 0,
-        "total_download_gb": 0
+        # Total data in whole GB (bytes >> 30)
+        "total_upload_gb": bytes_sent >> 30,
+        "total_download_gb": bytes_recv >> 30
     }
 
-    # Total data in GB
-    stats["total_upload_gb"] = net_io.bytes_sent / (1024**3)
-    stats["total_download_gb"] = net_io.bytes_recv / (1024**3)
-
     # Calculate throughput if we have previous data
-    if _network_stats_prev and _network_stats_time:
-        time_delta = current_time - _network_stats_time
+    if _prev_time:
+        time_delta = current_time - _prev_time
         if time_delta > 0:
-            sent_delta = net_io.bytes_sent - _network_stats_prev["bytes_sent"]
-            recv_delta = net_io.bytes_recv - _network_stats_prev["bytes_recv"]
-
-            stats["upload_speed_bps"] = sent_delta / time_delta
-            stats["download_speed_bps"] = recv_delta / time_delta
+            stats["upload_speed_bps"] = (bytes_sent - _prev_sent) / time_delta
+            stats["download_speed_bps"] = (bytes_recv - _prev_recv) / time_delta
 
     # Store current stats for next call
-    _network_stats_prev = {
-        "bytes_sent": net_io.bytes_sent,
-        "bytes_recv": net_io.bytes_recv
-    }
-    _network_stats_time = current_time
+    _prev_sent = bytes_sent
+    _prev_recv = bytes_recv
+    _prev_time = current_time
+    _net_stats = stats
 
     return stats
 
@@ -233,8 +593,13 @@ def discover_sensors():
     # Add psutil system metrics
     print("\n[1/3] Discovering system metrics (psutil)...")
 
-    # Warm up psutil for accurate readings
-    psutil.cpu_percent(interval=0.1)
+    # Prime psutil's CPU counter without blocking; the first non-blocking
+    # reading has nothing to compare against, so the GUI shows 0 for CPU
+    # and the real value appears once monitoring starts
+    psutil.cpu_percent(interval=None)
+
+    # One snapshot feeds both RAM entries
+    vm = psutil.virtual_memory()
 
     sensor_database["system"].append({
         "name": "CPU",
@@ -244,7 +609,7 @@ def discover_sensors():
         "unit": "%",
         "psutil_method": "cpu_percent",
         "custom_label": "",
-        "current_value": int(psutil.cpu_percent(interval=0))
+        "current_value": 0
     })
 
     sensor_database["system"].append({
@@ -255,7 +620,7 @@ def discover_sensors():
         "unit": "%",
         "psutil_method": "virtual_memory.percent",
         "custom_label": "",
-        "current_value": int(psutil.virtual_memory().percent)
+        "current_value": int(vm.percent)
     })
 
     sensor_database["system"].append({
@@ -266,7 +631,7 @@ def discover_sensors():
         "unit": "GB",
         "psutil_method": "virtual_memory.used",
         "custom_label": "",
-        "current_value": int(psutil.virtual_memory().used / (1024**3))
+        "current_value": vm.used >> 30
     })
 
     # Disk usage for root partition
@@ -278,7 +643,7 @@ def discover_sensors():
         "unit": "%",
         "psutil_method": "disk_usage",
         "custom_label": "",
-        "current_value": int(psutil.disk_usage('/').percent)
+        "current_value": int(get_disk_usage().percent)
     })
 
     print(f"  Found {len(sensor_database['system'])} system metrics")
@@ -296,6 +661,7 @@ def discover_sensors():
             "source": "ioreg",
             "type": "temperature",
             "unit": "°C",
+            "sensor_key": temp["name"],
             "custom_label": "",
             "current_value": int(temp["value"])
         })
@@ -308,6 +674,7 @@ def discover_sensors():
             "source": "ioreg",
             "type": "fan",
             "unit": "RPM",
+            "sensor_key": fan["name"],
             "custom_label": "",
             "current_value": int(fan["value"])
         })
@@ -318,9 +685,8 @@ def discover_sensors():
     # Discover network metrics
     print("\n[3/3] Discovering network metrics...")
 
-    # Initialize network stats for throughput
-    get_network_stats()
-    time.sleep(1)  # Wait for delta calculation
+    # First sample seeds the throughput delta; speeds read 0 here and
+    # populate after one update_interval of monitoring
     net_stats = get_network_stats()
 
     # Data totals
@@ -332,7 +698,7 @@ def discover_sensors():
         "unit": "GB",
         "psutil_method": "net_io_recv",
         "custom_label": "",
-        "current_value": int(net_stats["total_download_gb"])
+        "current_value": net_stats["total_download_gb"]
     })
 
     sensor_database["data"].append({
@@ -343,7 +709,7 @@ def discover_sensors():
         "unit": "GB",
         "psutil_method": "net_io_sent",
         "custom_label": "",
-        "current_value": int(net_stats["total_upload_gb"])
+        "current_value": net_stats["total_upload_gb"]
     })
 
     # Throughput (speed) - in KB/s
@@ -374,7 +740,7 @@ def discover_sensors():
 
     print("\n" + "=" * 60)
     print("\nNote: Sensor values in GUI are from launch time.")
-    print("  Network speeds update after 1 second of monitoring.")
+    print("  Network speeds show 0 here and update after one interval of monitoring.")
 
 
 def get_unit_from_type(sensor_type):
@@ -396,8 +762,12 @@ def load_config():
         return None
 
     try:
-        with open(CONFIG_FILE, 'r') as f:
-            config = json.load(f)
+        if ORJSON_AVAILABLE:
+            with open(CONFIG_FILE, 'rb') as f:
+                config = orjson.loads(f.read())
+        else:
+            with open(CONFIG_FILE, 'r') as f:
+                config = json.load(f)
 
         # Version check - show info if old version
         config_version = config.get("version", "1.0")
@@ -421,8 +791,12 @@ def load_config():
 def save_config(config):
     """Save configuration to file"""
     try:
-        with open(CONFIG_FILE, 'w') as f:
-            json.dump(config, f, indent=2)
+        if ORJSON_AVAILABLE:
+            with open(CONFIG_FILE, 'wb') as f:
+                f.write(orjson.dumps(config, option=orjson.OPT_INDENT_2))
+        else:
+            with open(CONFIG_FILE, 'w') as f:
+                json.dump(config, f, indent=2)
         print(f"\nConfiguration saved to {CONFIG_FILE}")
         return True
     except Exception as e:
@@ -510,6 +884,7 @@ class MetricSelectorGUI:
     Tkinter GUI for selecting metrics and configuring settings
     """
     def __init__(self, root, existing_config=None):
+        _ensure_tk()
         self.root = root
         self.root.title("PC Monitor v2.1 - macOS Configuration")
         self.root.geometry("1200x800")
@@ -518,6 +893,11 @@ class MetricSelectorGUI:
         self.selected_metrics = []
         self.checkboxes = []
         self.label_entries = {}
+        self._preview_cache = []  # "N. label" per selected metric, in order
+
+        # Autostart status: plist path resolved once, existence cached briefly
+        self._plist_path = os.path.expanduser("~/Library/LaunchAgents/com.pctools.monitor.plist")
+        self._autostart_cache = {"t": 0.0, "v": None}
 
         # Load existing config if available
         if existing_config:
@@ -666,18 +1046,8 @@ class MetricSelectorGUI:
         scrollbar = ttk.Scrollbar(main_frame, orient="vertical", command=canvas.yview)
         scrollable_frame = tk.Frame(canvas, bg="#ffffff")
 
-        scrollable_frame.bind(
-            "<Configure>",
-            lambda e: canvas.configure(scrollregion=canvas.bbox("all"))
-        )
-
-        canvas.create_window((0, 0), window=scrollable_frame, anchor="nw")
-        canvas.configure(yscrollcommand=scrollbar.set)
-
-        canvas.pack(side="left", fill="both", expand=True)
-        scrollbar.pack(side="right", fill="y")
-
-        # Create checkboxes by category
+        # Create checkboxes by category. The scrollable frame is not placed
+        # in the canvas until every row exists, so Tk lays it out once.
         row = 0
         col = 0
 
@@ -704,15 +1074,24 @@ class MetricSelectorGUI:
                 bg="#f0f0f0",
                 fg="#333333"
             )
-            cat_label.pack(pady=5)
+            cat_label.pack(pady=(5, 0))
+
+            # One hint per category instead of a "Label:" widget per sensor
+            tk.Label(cat_frame, text="Custom label (right, max 10 chars)", bg="#f0f0f0",
+                     fg="#666", font=("Arial", 8)).pack(pady=(0, 3))
 
-            # Sensors in category
+            # Sensors in category - three widgets per row: frame, checkbox, entry
             for sensor in sensor_database[cat_key]:
                 var = tk.BooleanVar()
+                # Runtime-only lookup key and search index (stripped again in save_and_start)
+                sensor["_key"] = f"{sensor['source']}_{sensor['display_name']}"
+                sensor["_dn_lower"] = sensor["display_name"].lower()
+                sensor["_n_lower"] = sensor["name"].lower()
 
                 # Create sensor row frame
                 sensor_frame = tk.Frame(cat_frame, bg="#f0f0f0")
                 sensor_frame.pack(fill=tk.X, padx=10, pady=2)
+                sensor_frame.columnconfigure(0, weight=1)
 
                 # Checkbox with current value
                 value_text = f" - {sensor['current_value']}{sensor['unit']}" \
@@ -725,25 +1104,19 @@ class MetricSelectorGUI:
                     anchor="w",
                     command=lambda s=sensor, v=var: self.on_checkbox_toggle(s, v)
                 )
-                cb.pack(side=tk.TOP, fill=tk.X)
+                cb.grid(row=0, column=0, sticky="we")
 
-                # Custom label entry (small, below checkbox)
-                label_frame = tk.Frame(sensor_frame, bg="#f0f0f0")
-                label_frame.pack(side=tk.TOP, fill=tk.X, padx=20)
-
-                tk.Label(label_frame, text="Label:", bg="#f0f0f0", fg="#666",
-                        font=("Arial", 8)).pack(side=tk.LEFT)
-                label_entry = tk.Entry(label_frame, width=15, font=("Arial", 8))
-                label_entry.pack(side=tk.LEFT, padx=5)
+                # Custom label entry (small, same row as checkbox)
+                label_entry = tk.Entry(sensor_frame, width=12, font=("Arial", 8))
+                label_entry.grid(row=0, column=1, sticky="e", padx=(5, 0))
 
                 # Update preview when label text changes
-                label_entry.bind("<KeyRelease>", lambda e: self.update_counter())
+                label_entry.bind("<KeyRelease>", lambda e, s=sensor: self.on_label_change(s))
 
                 # Store reference to label entry
-                sensor_key = f"{sensor['source']}_{sensor['display_name']}"
-                self.label_entries[sensor_key] = {
+                self.label_entries[sensor["_key"]] = {
                     'entry': label_entry,
-                    'frame': label_frame
+                    'frame': sensor_frame
                 }
 
                 self.checkboxes.append((cb, sensor, var, sensor_frame))
@@ -753,6 +1126,17 @@ class MetricSelectorGUI:
                 col = 0
                 row += 1
 
+        scrollable_frame.bind(
+            "<Configure>",
+            lambda e: canvas.configure(scrollregion=canvas.bbox("all"))
+        )
+
+        canvas.create_window((0, 0), window=scrollable_frame, anchor="nw")
+        canvas.configure(yscrollcommand=scrollbar.set)
+
+        canvas.pack(side="left", fill="both", expand=True)
+        scrollbar.pack(side="right", fill="y")
+
         # Preview frame
         preview_frame = tk.Frame(self.root, bg="#2d2d2d", height=40)
         preview_frame.pack(fill=tk.X)
@@ -809,16 +1193,19 @@ class MetricSelectorGUI:
         )
         save_btn.pack(side=tk.RIGHT, padx=20, pady=8)
 
+        # Single geometry pass for everything created above
+        self.root.update_idletasks()
+
         # Update counter
         self.update_counter()
 
     def load_existing_metrics(self, metrics):
         """Load existing metric selections when editing config"""
         for metric in metrics:
+            metric_key = f"{metric['source']}_{metric['display_name']}"
             # Find matching sensor and check it
             for cb, sensor, var, frame in self.checkboxes:
-                sensor_key = f"{sensor['source']}_{sensor['display_name']}"
-                metric_key = f"{metric['source']}_{metric['display_name']}"
+                sensor_key = sensor["_key"]
 
                 if sensor_key == metric_key:
                     # Add to selected_metrics
@@ -856,9 +1243,9 @@ class MetricSelectorGUI:
 
     def get_display_label_for_metric(self, sensor):
         """Get custom label if set, otherwise return sensor name"""
-        sensor_key = f"{sensor['source']}_{sensor['display_name']}"
-        if sensor_key in self.label_entries:
-            custom = self.label_entries[sensor_key]['entry'].get().strip()
+        entry = self.label_entries.get(sensor["_key"])
+        if entry:
+            custom = entry['entry'].get().strip()
             if custom:
                 return custom[:10]  # Enforce 10 char limit
         return sensor['name']
@@ -873,8 +1260,22 @@ class MetricSelectorGUI:
             self.counter_label.config(fg="#ffffff")
 
         # Update preview - now shows custom labels
-        preview = " | ".join([f"{i+1}. {self.get_display_label_for_metric(m)}"
-                              for i, m in enumerate(self.selected_metrics[:MAX_METRICS])])
+        self._preview_cache = [f"{i+1}. {self.get_display_label_for_metric(m)}"
+                               for i, m in enumerate(self.selected_metrics[:MAX_METRICS])]
+        self.render_preview()
+
+    def on_label_change(self, sensor):
+        """Refresh only the preview slot of the sensor whose label was edited"""
+        try:
+            i = self.selected_metrics.index(sensor)
+        except ValueError:
+            return  # Not selected - preview unaffected
+        if i < len(self._preview_cache):
+            self._preview_cache[i] = f"{i+1}. {self.get_display_label_for_metric(sensor)}"
+            self.render_preview()
+
+    def render_preview(self):
+        preview = " | ".join(self._preview_cache)
         self.preview_text.config(text=preview if preview else "(none selected)")
 
     def clear_all(self):
@@ -886,7 +1287,7 @@ class MetricSelectorGUI:
     def on_search(self, *args):
         search_term = self.search_var.get().lower()
         for cb, sensor, var, frame in self.checkboxes:
-            if search_term in sensor['display_name'].lower() or search_term in sensor['name'].lower():
+            if search_term in sensor["_dn_lower"] or search_term in sensor["_n_lower"]:
                 cb.config(bg="#ffffcc")
                 frame.config(bg="#ffffcc")
             else:
@@ -894,12 +1295,13 @@ class MetricSelectorGUI:
                 frame.config(bg="#f0f0f0")
 
     def get_autostart_status_text(self):
-        """Check if autostart is enabled"""
-        plist_path = os.path.expanduser("~/Library/LaunchAgents/com.pctools.monitor.plist")
-        if os.path.exists(plist_path):
-            return "Enabled"
-        else:
-            return "Disabled"
+        """Check if autostart is enabled (re-checked at most once a second)"""
+        now = time.monotonic()
+        cache = self._autostart_cache
+        if cache["v"] is None or now - cache["t"] >= 1.0:
+            cache["v"] = "Enabled" if os.path.exists(self._plist_path) else "Disabled"
+            cache["t"] = now
+        return cache["v"]
 
     def get_autostart_status_color(self):
         """Get color for autostart status"""
@@ -919,6 +1321,7 @@ class MetricSelectorGUI:
     def enable_autostart(self):
         """Enable autostart"""
         success = setup_autostart(enable=True)
+        self._autostart_cache["v"] = None
         if success:
             self.update_autostart_status()
             messagebox.showinfo("Success",
@@ -931,6 +1334,7 @@ class MetricSelectorGUI:
     def disable_autostart(self):
         """Disable autostart"""
         success = setup_autostart(enable=False)
+        self._autostart_cache["v"] = None
         if success:
             self.update_autostart_status()
             messagebox.showinfo("Success", "Autostart disabled!")
@@ -969,13 +1373,14 @@ class MetricSelectorGUI:
 
         # Assign IDs and add custom labels
         for i, sensor in enumerate(self.selected_metrics):
-            metric_config = sensor.copy()
+            # Drop runtime-only keys such as "_key"
+            metric_config = {k: v for k, v in sensor.items() if not k.startswith("_")}
             metric_config["id"] = i + 1
 
             # Get custom label if set
-            sensor_key = f"{sensor['source']}_{sensor['display_name']}"
-            if sensor_key in self.label_entries:
-                custom_label = self.label_entries[sensor_key]['entry'].get().strip()
+            entry = self.label_entries.get(sensor["_key"])
+            if entry:
+                custom_label = entry['entry'].get().strip()
                 if custom_label:
                     metric_config["custom_label"] = custom_label[:10]  # Max 10 chars
 
@@ -989,89 +1394,330 @@ class MetricSelectorGUI:
             messagebox.showerror("Error", "Failed to save configuration!")
 
 
-def get_metric_value(metric_config):
+# Shared reading each psutil_method needs from the per-cycle snapshot
+_SNAPSHOT_NEEDS = {
+    "virtual_memory.percent": "vm",
+    "virtual_memory.used": "vm",
+    "disk_usage": "disk",
+    "net_io_recv": "net",
+    "net_io_sent": "net",
+    "net_speed_down": "net",
+    "net_speed_up": "net",
+}
+
+
+def get_snapshot_needs(config):
+    """
+    Return the set of shared readings the configured metrics use
+    (computed once and cached on the config as "_needs")
+    """
+    needs = config.get("_needs")
+    if needs is None:
+        needs = set()
+        for metric_config in config["metrics"]:
+            if metric_config["source"] == "ioreg":
+                needs.add("ioreg")
+            else:
+                need = _SNAPSHOT_NEEDS.get(metric_config.get("psutil_method", ""))
+                if need:
+                    needs.add(need)
+        needs = frozenset(needs)
+        config["_needs"] = needs
+    return needs
+
+
+def build_snapshot(config):
+    """
+    Take each shared reading once per send cycle so several metrics
+    backed by the same psutil call don't hit the kernel repeatedly
+    """
+    needs = get_snapshot_needs(config)
+    if "ioreg" in needs:
+        # Overlap an ioreg subprocess (if used) with the psutil reads below
+        _ioreg_cache.begin_refresh()
+
+    snapshot = {}
+    if "vm" in needs:
+        snapshot["vm"] = cached_virtual_memory()
+    if "disk" in needs:
+        snapshot["disk"] = get_disk_usage()
+    if "net" in needs:
+        snapshot["net"] = get_network_stats()
+    if "ioreg" in needs:
+        _ioreg_cache.refresh()
+        snapshot["ioreg"] = _ioreg_cache
+    return snapshot
+
+
+# psutil_method -> extractor reading the per-cycle snapshot
+_PSUTIL_EXTRACTORS = {
+    "cpu_percent": lambda snapshot: int(cached_cpu_percent()),
+    "virtual_memory.percent": lambda snapshot: int(snapshot["vm"].percent),
+    "virtual_memory.used": lambda snapshot: snapshot["vm"].used >> 30,  # GB
+    "disk_usage": lambda snapshot: int(snapshot["disk"].percent),
+    "net_io_recv": lambda snapshot: snapshot["net"]["total_download_gb"],
+    "net_io_sent": lambda snapshot: snapshot["net"]["total_upload_gb"],
+    "net_speed_down": lambda snapshot: int(snapshot["net"]["download_speed_bps"] / 1024),  # KB/s
+    "net_speed_up": lambda snapshot: int(snapshot["net"]["upload_speed_bps"] / 1024),  # KB/s
+}
+
+
+# Metric type -> IoregCache kind
+_IOREG_KINDS = {"temperature": "temperatures", "fan": "fans"}
+
+# Display names saved by the ioreg text parser before sensors were named by
+# their location: fans were "FAN", "FAN2", ... and the fallback temperature "CPU"
+_LEGACY_FAN_RE = re.compile(r"FAN(\d*) Speed$")
+
+
+def _legacy_ioreg_position(kind, display_name):
+    """Position among the sensors of kind that an old display name referred to, or None"""
+    if kind == "fans":
+        match = _LEGACY_FAN_RE.match(display_name)
+        if match:
+            return max(int(match.group(1) or 1) - 1, 0)
+    elif kind == "temperatures" and display_name == "CPU Temperature":
+        return 0
+    return None
+
+
+def get_metric_value(metric_config, snapshot):
     """
     Get current value for a configured metric
+    snapshot: shared readings for this cycle (see build_snapshot)
     """
     source = metric_config["source"]
 
     if source == "psutil":
         method = metric_config.get("psutil_method", "")
 
-        if method == "cpu_percent":
-            return int(psutil.cpu_percent(interval=0))
-        elif method == "virtual_memory.percent":
-            return int(psutil.virtual_memory().percent)
-        elif method == "virtual_memory.used":
-            return int(psutil.virtual_memory().used / (1024**3))  # GB
-        elif method == "disk_usage":
-            return int(psutil.disk_usage('/').percent)
-        elif method == "net_io_recv":
-            return int(psutil.net_io_counters().bytes_recv / (1024**3))
-        elif method == "net_io_sent":
-            return int(psutil.net_io_counters().bytes_sent / (1024**3))
-        elif method == "net_speed_down":
-            net_stats = get_network_stats()
-            return int(net_stats["download_speed_bps"] / 1024)  # KB/s
-        elif method == "net_speed_up":
-            net_stats = get_network_stats()
-            return int(net_stats["upload_speed_bps"] / 1024)  # KB/s
+        extract = _PSUTIL_EXTRACTORS.get(method)
+        if extract:
+            return extract(snapshot)
 
     elif source == "ioreg":
-        # Refresh ioreg sensors and find matching value
-        ioreg_sensors = get_ioreg_sensors()
+        ioreg_sensors = snapshot["ioreg"]
         sensor_name = metric_config.get("display_name", "")
 
-        if metric_config.get("type") == "temperature":
-            for temp in ioreg_sensors["temperatures"]:
-                if sensor_name in temp["name"] or temp["name"] in sensor_name:
-                    return int(temp["value"])
-        elif metric_config.get("type") == "fan":
-            for i, fan in enumerate(ioreg_sensors["fans"]):
-                if sensor_name in fan["name"] or fan["name"] in sensor_name:
-                    return int(fan["value"])
+        # Exact sensor name (saved at discovery) first, then substring scan
+        kind = _IOREG_KINDS.get(metric_config.get("type"))
+        sensor_key = metric_config.get("sensor_key")
+        if kind and sensor_key:
+            value = ioreg_sensors.get(kind, sensor_key.lower())
+            if value is not None:
+                return int(value)
+
+        if kind:
+            sensors = ioreg_sensors.sensors(kind)
+            for name, value in sensors:
+                if sensor_name in name or name in sensor_name:
+                    return int(value)
+
+            # No name matches - an old config may still refer to it by position
+            position = _legacy_ioreg_position(kind, sensor_name)
+            if position is not None and position < len(sensors):
+                return int(sensors[position][1])
 
     return 0
 
 
-def send_metrics(sock, config):
+def _ioreg_extractor(metric_config, ioreg_cache):
     """
-    Collect metric values and send to ESP32 via UDP
+    Resolve an ioreg metric to an exact sensor name once, so each cycle is a
+    single dict lookup; falls back to get_metric_value if the sensor is gone
     """
-    # Build JSON payload (Protocol v2.0)
-    payload = {
-        "version": "2.0",
-        "timestamp": datetime.now().strftime('%H:%M'),
-        "metrics": []
-    }
+    kind = _IOREG_KINDS.get(metric_config.get("type"))
+    if kind is None:
+        return lambda snapshot: 0
+
+    # Configs saved before "sensor_key" existed: resolve by display name
+    key = metric_config.get("sensor_key")
+    if not key:
+        sensor_name = metric_config.get("display_name", "")
+        for name, _ in ioreg_cache.sensors(kind):
+            if sensor_name in name or name in sensor_name:
+                key = name
+                break
+        else:
+            return functools.partial(get_metric_value, metric_config)
+    key = key.lower()
 
+    def extract(snapshot):
+        value = snapshot["ioreg"].get(kind, key)
+        if value is not None:
+            return int(value)
+        return get_metric_value(metric_config, snapshot)
+    return extract
+
+
+def build_metric_extractors(config):
+    """
+    Build one extractor per configured metric (cached on the config as
+    "_extractors"). Each takes the cycle snapshot and returns the value.
+    """
+    if "ioreg" in get_snapshot_needs(config):
+        _ioreg_cache.refresh()
+    extractors = []
     for metric_config in config["metrics"]:
-        value = get_metric_value(metric_config)
-
-        # Use custom label if set, otherwise use generated name
-        display_name = metric_config.get("custom_label", "")
-        if not display_name:
-            display_name = metric_config["name"]
-
-        metric_data = {
-            "id": metric_config["id"],
-            "name": display_name,
-            "value": value,
-            "unit": metric_config["unit"]
+        if metric_config["source"] == "psutil":
+            extract = _PSUTIL_EXTRACTORS.get(metric_config.get("psutil_method", ""),
+                                             lambda snapshot: 0)
+        elif metric_config["source"] == "ioreg":
+            extract = _ioreg_extractor(metric_config, _ioreg_cache)
+        else:
+            extract = lambda snapshot: 0
+        extractors.append(extract)
+    config["_extractors"] = extractors
+    return extractors
+
+
+def make_udp_socket():
+    """
+    Create a non-blocking UDP socket tuned for sending: larger send buffer,
+    low-delay TOS and (on macOS) SO_NOSIGPIPE
+    """
+    sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+    sock.setblocking(False)
+    options = [
+        (socket.SOL_SOCKET, socket.SO_SNDBUF, UDP_SNDBUF),
+        (socket.IPPROTO_IP, socket.IP_TOS, getattr(socket, "IPTOS_LOWDELAY", 0x10)),
+    ]
+    if sys.platform == "darwin":
+        options.append((socket.SOL_SOCKET, SO_NOSIGPIPE, 1))
+    for level, option, value in options:
+        try:
+            sock.setsockopt(level, option, value)
+        except OSError:
+            pass  # Tuning only - the defaults still work
+    return sock
+
+
+def get_udp_socket():
+    """
+    Return the module-level UDP socket, creating it on first use.
+    Recreated if a previous owner closed it.
+    """
+    global _udp_sock
+    if _udp_sock is None or _udp_sock.fileno() == -1:
+        _udp_sock = make_udp_socket()
+    return _udp_sock
+
+
+def get_timestamp():
+    """Return the current local time as HH:MM, reformatted only when the minute changes"""
+    now = time.time()
+    minute = int(now // 60)
+    if minute != _ts_cache["minute"]:
+        _ts_cache["minute"] = minute
+        _ts_cache["str"] = time.strftime('%H:%M', time.localtime(now))
+    return _ts_cache["str"]
+
+
+def get_display_labels(config):
+    """Custom label if set, otherwise generated name, per metric (cached as "_labels")"""
+    labels = config.get("_labels")
+    if labels is None:
+        labels = [m.get("custom_label", "") or m["name"] for m in config["metrics"]]
+        config["_labels"] = labels
+    return labels
+
+
+def build_payload_template(config):
+    """
+    Pre-encode the static part of the Protocol v2.0 payload (cached as
+    "_template"). Only the timestamp and the values change per cycle, so
+    template % (timestamp, *values) yields the same bytes as the compact
+    json.dumps() of the full payload. Names and units go through json.dumps
+    for escaping, with '%' doubled so it survives the formatting.
+    """
+    def encode(text):
+        return json.dumps(text).replace('%', '%%')
+
+    parts = []
+    for metric_config, label in zip(config["metrics"], get_display_labels(config)):
+        parts.append('{"id":' + str(int(metric_config["id"])) +
+                     ',"name":' + encode(label) +
+                     ',"value":%d,"unit":' + encode(metric_config["unit"]) + '}')
+    template = ('{"version":"2.0","timestamp":"%s","metrics":[' +
+                ','.join(parts) + ']}').encode('ascii')
+    config["_template"] = template
+    return template
+
+
+def _dumps(obj):
+    """Compact JSON as bytes (orjson when available)"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj)
+    return json.dumps(obj, separators=(',', ':')).encode('utf-8')
+
+
+def build_payload(config, timestamp, values):
+    """
+    Full Protocol v2.0 payload dict. The payload and its per-metric dicts
+    are allocated once (cached as "_payload"); each call only fills in the
+    timestamp and values.
+    """
+    payload = config.get("_payload")
+    if payload is None:
+        payload = config["_payload"] = {
+            "version": "2.0",
+            "timestamp": "",
+            "metrics": [
+                {"id": m["id"], "name": label, "value": 0, "unit": m["unit"]}
+                for m, label in zip(config["metrics"], get_display_labels(config))
+            ]
         }
-        payload["metrics"].append(metric_data)
+    payload["timestamp"] = timestamp
+    for slot, value in zip(payload["metrics"], values):
+        slot["value"] = value
+    return payload
+
+
+def send_metrics(sock, config):
+    """
+    Collect metric values and send to ESP32 via UDP
+    sock: asyncio datagram transport on a socket connected to the ESP32,
+    or a _SocketSender until that connect succeeds (see MetricSender)
+    """
+    extractors = config.get("_extractors")
+    if extractors is None:
+        extractors = build_metric_extractors(config)
+    template = config.get("_template")
+    if template is None:
+        template = build_payload_template(config)
+
+    snapshot = build_snapshot(config)
+    timestamp = get_timestamp()
+    values = [extract(snapshot) for extract in extractors]
+
+    # Sample-and-hold: skip the send if nothing changed since the last one,
+    # unless a metric is flagged "realtime" or the heartbeat is due
+    realtime = config.get("_realtime")
+    if realtime is None:
+        realtime = config["_realtime"] = any(m.get("realtime") for m in config["metrics"])
+    now = time.monotonic()
+    state = (timestamp, values)
+    if (not realtime and state == config.get("_last_state")
+            and now - config.get("_last_sent", 0.0) < HEARTBEAT_INTERVAL):
+        return True
 
-    # Send via UDP
+    # Send via UDP - one compact datagram per cycle (Protocol v2.0)
     try:
-        message = json.dumps(payload).encode('utf-8')
-        sock.sendto(message, (config["esp32_ip"], config["udp_port"]))
+        try:
+            message = template % (timestamp.encode('ascii'), *values)
+        except TypeError:
+            # A non-numeric value - encode the full payload instead
+            message = _dumps(build_payload(config, timestamp, values))
+        sock.sendto(message)
+        config["_last_state"] = state
+        config["_last_sent"] = now
 
         # Print status
-        timestamp = payload["timestamp"]
-        metrics_str = " | ".join([f"{m['name']}:{m['value']}{m['unit']}"
-                                   for m in payload["metrics"][:4]])
-        if len(payload["metrics"]) > 4:
-            metrics_str += f" ... +{len(payload['metrics'])-4} more"
+        labels = get_display_labels(config)
+        metrics_str = " | ".join([f"{label}:{value}{m['unit']}" for m, label, value
+                                  in zip(config["metrics"][:4], labels, values)])
+        if len(values) > 4:
+            metrics_str += f" ... +{len(values)-4} more"
         print(f"[{timestamp}] {metrics_str}")
 
         return True
@@ -1080,6 +1726,159 @@ def send_metrics(sock, config):
         return False
 
 
+class _SocketSender:
+    """
+    Stand-in for the datagram transport while it doesn't exist yet:
+    send() on a connected socket, otherwise sendto() the ESP32 address
+    """
+    def __init__(self, sock, addr, connected):
+        self.sock = sock
+        self.addr = addr
+        self.connected = connected
+
+    def sendto(self, data):
+        if self.connected:
+            self.sock.send(data)
+        else:
+            self.sock.sendto(data, self.addr)
+
+
+class MetricSender(asyncio.DatagramProtocol):
+    """
+    Datagram protocol that sends metrics every update_interval. Sends are
+    scheduled on absolute loop.time() deadlines so the time spent sending
+    doesn't add up to drift.
+
+    The transport is only created once sock is connected to the ESP32 (a
+    transport on an unconnected socket has no address to send to). Until
+    then every tick retries the connect and sends via _SocketSender.
+    """
+    def __init__(self, config, sock=None):
+        self.config = config
+        self.sock = sock
+        self.transport = None
+        self._handle = None
+        self._next = 0.0
+        self._connecting = False
+        self._connect_error = None  # Address of the last failed connect, reported once
+
+    def connection_made(self, transport):
+        self.transport = transport
+
+    def connect(self):
+        """
+        Connect sock to the configured ESP32 address and create the
+        transport on first success. Returns True if connected.
+        """
+        addr = (self.config["esp32_ip"], self.config["udp_port"])
+        try:
+            self.sock.connect(addr)
+        except OSError as e:
+            if addr != self._connect_error:
+                print(f"Error connecting UDP socket: {e}")
+                self._connect_error = addr
+            return False
+        self._connect_error = None
+
+        if self.transport is None and not self._connecting:
+            self._connecting = True
+            loop = asyncio.get_event_loop()
+            task = loop.create_task(loop.create_datagram_endpoint(lambda: self, sock=self.sock))
+            task.add_done_callback(self._endpoint_done)
+        return True
+
+    def _endpoint_done(self, task):
+        self._connecting = False
+        if not task.cancelled() and task.exception() is not None:
+            print(f"Error creating UDP transport: {task.exception()}")
+
+    def connection_lost(self, exc):
+        self.transport = None
+        if exc is not None:
+            # A fatal transport error also closes the socket - keep ticking on
+            # a fresh one; the next tick reconnects and rebuilds the transport
+            print(f"UDP transport closed: {exc}")
+            self.sock = make_udp_socket()
+
+    def start(self, delay):
+        """Schedule the first send delay seconds from now"""
+        loop = asyncio.get_event_loop()
+        self._next = loop.time() + delay
+        self._handle = loop.call_at(self._next, self.tick)
+
+    def tick(self):
+        try:
+            transport = self.transport
+            if transport is None:
+                connected = self.connect()
+                transport = _SocketSender(
+                    self.sock, (self.config["esp32_ip"], self.config["udp_port"]), connected)
+            send_metrics(transport, self.config)
+        except Exception as e:
+            # A failed read must not stop the schedule - report and try again next tick
+            print(f"Error collecting metrics: {e}")
+
+        loop = asyncio.get_event_loop()
+        interval = self.config["update_interval"]
+        self._next += interval
+        now = loop.time()
+        if self._next < now - interval:
+            # Fell more than a whole interval behind (e.g. after sleep) -
+            # resync instead of sending a burst of catch-up ticks
+            self._next = now
+        self._handle = loop.call_at(self._next, self.tick)
+
+    def stop(self):
+        if self._handle is not None:
+            self._handle.cancel()
+            self._handle = None
+
+
+def run_sender_loop(loop, config, reload_fd=None):
+    """
+    Run a MetricSender on loop until loop.stop() is called
+    (from another thread: loop.call_soon_threadsafe(loop.stop))
+    reload_fd: read end of a pipe; a write to it reloads the config file
+    """
+    asyncio.set_event_loop(loop)
+    sock = get_udp_socket()
+
+    # The ESP32 address is fixed for the session - connect once so each
+    # send skips the per-call address handling (retried per tick on failure)
+    sender = MetricSender(config, sock)
+    sender.connect()
+
+    def reload_config():
+        os.read(reload_fd, 512)
+        new_config = load_config()
+        if new_config and new_config.get("metrics"):
+            # Fresh dict - extractors, template etc. are rebuilt on next send
+            old_config, sender.config = sender.config, new_config
+            if (new_config["esp32_ip"], new_config["udp_port"]) != \
+                    (old_config["esp32_ip"], old_config["udp_port"]):
+                sender.connect()  # a UDP socket can simply be re-connected
+
+    if reload_fd is not None:
+        loop.add_reader(reload_fd, reload_config)
+
+    try:
+        # Warm up psutil and network stats; first send after 1s
+        psutil.cpu_percent(interval=None)
+        get_network_stats()
+        sender.start(1)
+        loop.run_forever()
+    finally:
+        if reload_fd is not None:
+            loop.remove_reader(reload_fd)
+        sender.stop()
+        if sender.transport is not None:
+            sender.transport.close()
+            loop.run_until_complete(asyncio.sleep(0))  # let the transport close its socket
+        else:
+            sender.sock.close()
+        loop.close()
+
+
 def run_monitoring(config):
     """Run monitoring loop in console mode"""
     print(f"\nMonitoring {len(config['metrics'])} metrics:")
@@ -1092,28 +1891,35 @@ def run_monitoring(config):
     print(f"Update Interval: {config['update_interval']}s")
     print("\nStarting monitoring... (Press Ctrl+C to stop)\n")
 
-    # Create UDP socket
-    sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
-
-    # Warm up psutil and network stats
-    psutil.cpu_percent(interval=1)
-    get_network_stats()
-    time.sleep(1)
-
     # Main monitoring loop
     try:
-        while True:
-            send_metrics(sock, config)
-            time.sleep(config["update_interval"])
+        run_sender_loop(asyncio.new_event_loop(), config)
     except KeyboardInterrupt:
         print("\n\nMonitoring stopped.")
-    finally:
-        sock.close()
+
+
+def launch_configure_gui():
+    """
+    Start the configuration GUI as a separate process and return its pid.
+    Uses posix_spawn so the menu bar (Cocoa) process is never forked;
+    falls back to subprocess.Popen where posix_spawn is unavailable.
+    """
+    args = [sys.executable, os.path.abspath(__file__), '--configure', '--no-monitor']
+    if hasattr(os, "posix_spawn"):
+        try:
+            return os.posix_spawn(sys.executable, args, os.environ, file_actions=[
+                (os.POSIX_SPAWN_OPEN, 1, os.devnull, os.O_WRONLY, 0),
+                (os.POSIX_SPAWN_OPEN, 2, os.devnull, os.O_WRONLY, 0),
+            ])
+        except OSError:
+            pass
+    return subprocess.Popen(args, stdout=subprocess.DEVNULL,
+                            stderr=subprocess.DEVNULL).pid
 
 
 def run_minimized(config):
     """Run monitoring loop in background with menu bar app (rumps)"""
-    if not RUMPS_AVAILABLE:
+    if not _ensure_rumps():
         print("\nWARNING: rumps not available, running in console mode")
         print("Install with: pip3 install rumps")
         run_monitoring(config)
@@ -1121,23 +1927,15 @@ def run_minimized(config):
 
     import threading
 
-    # Create stop event for monitoring thread
-    stop_event = threading.Event()
-
-    def monitoring_thread():
-        """Background thread that sends metrics"""
-        sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
-
-        # Warm up
-        psutil.cpu_percent(interval=1)
-        get_network_stats()
-        time.sleep(1)
+    # Event loop for the send loop; rumps owns the main thread
+    loop = asyncio.new_event_loop()
 
-        while not stop_event.is_set():
-            send_metrics(sock, config)
-            time.sleep(config["update_interval"])
+    # Written to when a Configure window closes so the loop reloads the config
+    reload_r, reload_w = os.pipe()
 
-        sock.close()
+    def monitoring_thread():
+        """Background thread running the asyncio send loop"""
+        run_sender_loop(loop, config, reload_fd=reload_r)
 
     # Start monitoring thread
     thread = threading.Thread(target=monitoring_thread, daemon=True)
@@ -1153,15 +1951,23 @@ def run_minimized(config):
     @app.menu("Configure")
     def configure_callback(_):
         """Open configuration GUI"""
-        # Use subprocess to launch config GUI in background
-        subprocess.Popen([sys.executable, os.path.abspath(__file__), '--configure'],
-                        stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        pid = launch_configure_gui()
+
+        def wait_and_reload():
+            # Reap the child, then pick up whatever it saved
+            os.waitpid(pid, 0)
+            os.write(reload_w, b"r")
+
+        threading.Thread(target=wait_and_reload, daemon=True).start()
 
     @app.menu("Quit")
     def quit_callback(_):
         """Stop monitoring and quit"""
-        stop_event.set()
-        time.sleep(0.5)  # Let thread finish
+        try:
+            loop.call_soon_threadsafe(loop.stop)
+            thread.join(timeout=1.0)  # Let the send loop close its socket
+        except RuntimeError:
+            pass  # Send loop already exited and closed its event loop
         app.quit()
 
     # Add status info
@@ -1206,6 +2012,8 @@ Examples:
                        help='Run minimized to menu bar')
     parser.add_argument('--detached', action='store_true',
                        help=argparse.SUPPRESS)  # Internal flag for background process
+    parser.add_argument('--no-monitor', action='store_true',
+                       help=argparse.SUPPRESS)  # Internal flag: exit after the GUI (menu bar Configure)
     args = parser.parse_args()
 
     # Auto-detach from terminal when running minimized (unless already detached)
@@ -1260,6 +2068,7 @@ Examples:
         discover_sensors()
 
         # Show GUI
+        _ensure_tk()
         root = tk.Tk()
         app = MetricSelectorGUI(root, config if args.edit else None)
         root.mainloop()
@@ -1271,6 +2080,10 @@ Examples:
         except tk.TclError:
             pass
 
+        # Launched from the menu bar app, which reloads the config itself
+        if args.no_monitor:
+            return
+
         # Reload config after GUI
         config = load_config()
         if config is None:
@@ -10,20 +10,23 @@ import json
 import os
 import sys
 import argparse
-from datetime import datetime
 import tkinter as tk
 from tkinter import ttk, messagebox
-from urllib import request as urllib_request
-from urllib import error as urllib_error
+import http.client
+import atexit
 import re
-
-# Try to import pystray for system tray support
-try:
-    import pystray
-    from PIL import Image, ImageDraw
-    TRAY_AVAILABLE = True
-except ImportError:
-    TRAY_AVAILABLE = False
+import math
+import concurrent.futures
+import functools
+import queue
+import threading
+
+# pystray and PIL are imported on first use (see _ensure_tray) so the
+# configuration GUI and console mode don't pay for loading them
+pystray = None
+Image = None
+ImageDraw = None
+TRAY_AVAILABLE = None  # None = not tried yet
 
 # Try to import pythoncom for COM initialization (needed for WMI with pythonw.exe)
 try:
@@ -32,6 +35,28 @@ try:
 except ImportError:
     PYTHONCOM_AVAILABLE = False
 
+# Optional faster JSON decoding for LHM REST API responses (falls back to stdlib json)
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+def _ensure_tray():
+    """Try to import pystray and PIL for system tray support; returns True if available"""
+    global pystray, Image, ImageDraw, TRAY_AVAILABLE
+    if TRAY_AVAILABLE is None:
+        try:
+            import pystray as _pystray
+            from PIL import Image as _Image, ImageDraw as _ImageDraw
+            pystray, Image, ImageDraw = _pystray, _Image, _ImageDraw
+            TRAY_AVAILABLE = True
+        except ImportError:
+            TRAY_AVAILABLE = False
+    return TRAY_AVAILABLE
+
+
 # Configuration file path - use absolute path to work correctly from any working directory
 # This fixes autostart issues where Windows ignores WorkingDirectory in shortcuts
 SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
@@ -49,6 +74,10 @@ DEFAULT_CONFIG = {
 # Maximum metrics supported by ESP32
 MAX_METRICS = 20  # Increased from 12 to support companion metrics
 
+# UDP send buffer size; the socket is non-blocking, so a full buffer drops
+# one update instead of stalling the monitoring loop
+UDP_SNDBUF = 64 * 1024
+
 # Global sensor database
 sensor_database = {
     "system": [],    # psutil-based metrics (CPU%, RAM%, Disk%)
@@ -71,6 +100,31 @@ rest_api_host = "localhost"
 rest_api_port = 8085
 use_rest_api = False  # Auto-detected; True when WMI fails but REST API works
 
+# Persistent keep-alive connection to the REST API (see _http_get). The
+# lock keeps threads (e.g. the GUI's discovery worker) from interleaving
+# requests on it.
+_http_conn = None
+_http_conn_key = None
+_http_lock = threading.RLock()
+
+# Latest /data.json sensors by SensorId, shared by the metrics of one
+# polling tick (see refresh_rest_snapshot)
+REST_SNAPSHOT_MAX_AGE = 0.5
+_rest_snapshot = {"ts": None, "ok": False, "by_id": {}}
+
+# Last check_rest_api_connectivity() result, reused for a short time so
+# back-to-back diagnostics don't download /data.json twice
+REST_PROBE_MAX_AGE = 2.0
+_rest_probe = {"ts": None, "key": None, "result": None}
+
+# WMI connection used by get_metric_value (see _get_wmi). COM objects
+# can't be shared between threads, so each thread keeps its own.
+_wmi_local = threading.local()
+
+# Latest WMI sensor values by Identifier, shared by the metrics of one
+# polling tick (see refresh_wmi_snapshot)
+_wmi_snapshot = {"ts": None, "ok": False, "by_id": {}}
+
 
 class LHMHealthMonitor:
     """
@@ -143,7 +197,7 @@ def discover_wmi_namespaces():
     try:
         import wmi
         w = wmi.WMI(namespace=namespace)
-        sensors = list(w.Sensor())
+        sensors = list(w.Sensor(["Identifier"]))
 
         if len(sensors) > 0:
             print(f"  ✓ WMI working with {len(sensors)} sensors")
@@ -158,9 +212,57 @@ def discover_wmi_namespaces():
         return [], None
 
 
-def get_librehardwaremonitor_version():
+def _find_lhm_process():
+    """
+    Scan running processes once for LibreHardwareMonitor (or a similar monitor)
+    A LibreHardwareMonitor process is preferred over other hardware monitors
+    Returns: proc.info dict with 'name' and 'exe', or None if not running
+    """
+    lhm_names = ["librehardwaremonitor", "libre hardware monitor",
+                 "hwmonitor", "hardware monitor"]
+    fallback = None
+    for proc in psutil.process_iter(['name', 'exe']):
+        try:
+            proc_name = proc.info['name'].lower()
+            if 'librehardwaremonitor' in proc_name:
+                return proc.info
+            if fallback is None and any(name in proc_name for name in lhm_names):
+                fallback = proc.info
+        except (psutil.NoSuchProcess, psutil.AccessDenied, AttributeError):
+            pass
+    return fallback
+
+
+# Common LibreHardwareMonitor installation paths, most likely first
+_POSSIBLE_LHM_PATHS = (
+    r"C:\Program Files\LibreHardwareMonitor\LibreHardwareMonitor.exe",
+    r"C:\Program Files (x86)\LibreHardwareMonitor\LibreHardwareMonitor.exe",
+    r"C:\Users\Public\Desktop\LibreHardwareMonitor.exe",
+)
+
+
+@functools.lru_cache(maxsize=None)
+def _find_lhm_executable():
+    """
+    Locate LibreHardwareMonitor.exe on PATH or in a common install location
+    The result is cached for the session (installs don't move while we run)
+    Returns: path or None
+    """
+    import shutil
+    exe_path = shutil.which("LibreHardwareMonitor.exe")
+    if exe_path:
+        return exe_path
+
+    for path in _POSSIBLE_LHM_PATHS:
+        if os.path.isfile(path):
+            return path
+    return None
+
+
+def get_librehardwaremonitor_version(lhm_proc=None):
     """
     Try to detect LibreHardwareMonitor version
+    lhm_proc: optional result of _find_lhm_process(), saves a second process scan
     Returns: version string or None
     """
     version = None
@@ -168,126 +270,235 @@ def get_librehardwaremonitor_version():
     # Method 1: Check executable version
     try:
         import win32api
-        import win32con
-        import os
-
-        # Common installation paths
-        possible_paths = [
-            r"C:\Program Files\LibreHardwareMonitor\LibreHardwareMonitor.exe",
-            r"C:\Program Files (x86)\LibreHardwareMonitor\LibreHardwareMonitor.exe",
-            r"C:\Users\Public\Desktop\LibreHardwareMonitor.exe",
-        ]
 
-        # Also check PATH
-        try:
-            import shutil
-            exe_path = shutil.which("LibreHardwareMonitor.exe")
-            if exe_path:
-                possible_paths.insert(0, exe_path)
-        except:
-            pass
-
-        for path in possible_paths:
-            if os.path.exists(path):
-                try:
-                    info = win32api.GetFileVersionInfo(path, "\\")
-                    ms = info['FileVersionMS']
-                    ls = info['FileVersionLS']
-                    version = f"{win32api.HIWORD(ms)}.{win32api.LOWORD(ms)}.{win32api.HIWORD(ls)}.{win32api.LOWORD(ls)}"
-                    return version
-                except:
-                    pass
+        path = _find_lhm_executable()
+        if path:
+            try:
+                info = win32api.GetFileVersionInfo(path, "\\")
+                ms = info['FileVersionMS']
+                ls = info['FileVersionLS']
+                version = f"{win32api.HIWORD(ms)}.{win32api.LOWORD(ms)}.{win32api.HIWORD(ls)}.{win32api.LOWORD(ls)}"
+                return version
+            except:
+                pass
     except:
         pass
 
-    # Method 2: Try to get version from WMI
+    # Method 2: Read the version from the running process's executable
     try:
-        import wmi
-        w = wmi.WMI()
-        # Try to find LibreHardwareMonitor process and get its version
-        import psutil
-        for proc in psutil.process_iter(['name', 'exe']):
-            try:
-                if 'librehardwaremonitor' in proc.info['name'].lower():
-                    exe_path = proc.info['exe']
-                    if exe_path and os.path.exists(exe_path):
-                        import win32api
-                        info = win32api.GetFileVersionInfo(exe_path, "\\")
-                        ms = info['FileVersionMS']
-                        ls = info['FileVersionLS']
-                        version = f"{win32api.HIWORD(ms)}.{win32api.LOWORD(ms)}.{win32api.HIWORD(ls)}.{win32api.LOWORD(ls)}"
-                        return version
-            except:
-                pass
+        if lhm_proc is None:
+            lhm_proc = _find_lhm_process()
+        if lhm_proc and 'librehardwaremonitor' in lhm_proc['name'].lower():
+            exe_path = lhm_proc['exe']
+            if exe_path and os.path.exists(exe_path):
+                import win32api
+                info = win32api.GetFileVersionInfo(exe_path, "\\")
+                ms = info['FileVersionMS']
+                ls = info['FileVersionLS']
+                version = f"{win32api.HIWORD(ms)}.{win32api.LOWORD(ms)}.{win32api.HIWORD(ls)}.{win32api.LOWORD(ls)}"
+                return version
     except:
         pass
 
     return None
 
 
-def extract_sensors_from_tree(node, sensor_list=None, parent_hardware=None):
+# Leading number in an LHM value string such as "45.0 °C" or "12.1 %"
+_NUM_RE = re.compile(r'[-+]?\d*\.?\d+')
+
+
+def _parse_value(value):
+    """
+    Parse the number from an LHM sensor value (e.g. "45.0 °C" -> 45.0).
+    Usual "<number> <unit>" strings are handled with split() + float();
+    anything else goes through _NUM_RE. Returns 0 if there is no number.
+    """
+    value_str = value if isinstance(value, str) else str(value)
+    try:
+        number = float(value_str.split(' ', 1)[0])
+        if math.isfinite(number):
+            return number
+    except ValueError:
+        pass
+    match = _NUM_RE.search(value_str)
+    return float(match.group()) if match else 0
+
+
+def flatten_sensor_tree(root, with_parent=False):
     """
-    Recursively extract all sensors from LibreHardwareMonitor REST API tree structure.
-    The API returns a hierarchical tree where actual sensors have a 'SensorId' field.
-    Tracks parent hardware name to provide better context for sensors.
+    Flatten the LibreHardwareMonitor REST API tree into {SensorId: sensor}.
+    The API returns a hierarchical tree where actual sensors have a 'SensorId'
+    field. Walks the tree iteratively, in document order.
+
+    with_parent: return copies of the sensor nodes with "_parent_hardware"
+    set to the enclosing hardware name, for better context when naming
     """
-    if sensor_list is None:
-        sensor_list = []
+    sensors = {}
+    stack = [(root, None)]
+    while stack:
+        node, parent_hardware = stack.pop()
 
-    # Check if this node is a hardware device (has children but no SensorId)
-    # Hardware nodes have Text like "Intel Ethernet I219-V" or "NVIDIA GeForce RTX 3080"
-    current_hardware = parent_hardware
-    if "Children" in node and "SensorId" not in node:
-        # This might be a hardware node - use its name as parent for children
-        if node.get("Text") and node.get("Text") != "Sensor":
-            current_hardware = node.get("Text")
+        if "SensorId" in node:
+            # An actual sensor
+            if with_parent:
+                node = node.copy()
+                if parent_hardware:
+                    node["_parent_hardware"] = parent_hardware
+            sensors[node["SensorId"]] = node
+        elif node.get("Text") and node.get("Text") != "Sensor" and "Children" in node:
+            # Hardware node, e.g. "Intel Ethernet I219-V" or "NVIDIA GeForce RTX 3080"
+            parent_hardware = node["Text"]
 
-    # If this node has a SensorId, it's an actual sensor
-    if "SensorId" in node:
-        # Add parent hardware name to sensor for better identification
-        sensor_copy = node.copy()
-        if current_hardware:
-            sensor_copy["_parent_hardware"] = current_hardware
-        sensor_list.append(sensor_copy)
+        children = node.get("Children")
+        if isinstance(children, list):
+            # Reversed so the stack pops children in their original order
+            stack.extend((child, parent_hardware) for child in reversed(children))
 
-    # Recursively process children
-    if "Children" in node and isinstance(node["Children"], list):
-        for child in node["Children"]:
-            extract_sensors_from_tree(child, sensor_list, current_hardware)
+    return sensors
 
-    return sensor_list
+
+def close_http_connection():
+    """Close the persistent REST API connection (reopened on next request)"""
+    global _http_conn, _http_conn_key
+    with _http_lock:
+        if _http_conn is not None:
+            _http_conn.close()
+        _http_conn = None
+        _http_conn_key = None
+
+
+atexit.register(close_http_connection)
+
+
+def _http_get(host, port, path="/data.json", timeout=3):
+    """
+    GET a path from the LibreHardwareMonitor web server over one reused
+    keep-alive connection instead of a new TCP connection per request.
+    Returns: (status, body bytes); raises OSError/HTTPException on failure
+    """
+    global _http_conn, _http_conn_key
+
+    with _http_lock:
+        if _http_conn is None or _http_conn_key != (host, port):
+            close_http_connection()
+            _http_conn = http.client.HTTPConnection(host, port, timeout=timeout)
+            _http_conn_key = (host, port)
+
+        _http_conn.timeout = timeout
+        # A connection that was already open may have been dropped by the
+        # server while idle - retry those once on a fresh connection
+        reused = _http_conn.sock is not None
+        if reused:
+            _http_conn.sock.settimeout(timeout)
+
+        try:
+            _http_conn.request("GET", path, headers={"User-Agent": "PC-Stats-Monitor/2.0"})
+            response = _http_conn.getresponse()
+            return response.status, response.read()
+        except (http.client.HTTPException, OSError):
+            _http_conn.close()
+            if not reused:
+                raise
+        _http_conn.request("GET", path, headers={"User-Agent": "PC-Stats-Monitor/2.0"})
+        response = _http_conn.getresponse()
+        return response.status, response.read()
+
+
+def _fetch_json(host, port, path="/data.json", timeout=3):
+    """
+    GET and decode a JSON document from the LibreHardwareMonitor web server.
+    The raw response bytes go straight to orjson when available.
+    Raises: OSError/HTTPException (including non-200 status), JSONDecodeError
+    """
+    status, body = _http_get(host, port, path, timeout)
+    if status != 200:
+        raise http.client.HTTPException(f"HTTP error {status}")
+    if ORJSON_AVAILABLE:
+        return orjson.loads(body)
+    return json.loads(body.decode('utf-8'))
+
+
+# REST API sensor type -> display unit
+_REST_UNIT_MAP = {
+    "temperature": "C",  # No degree symbol - OLED can't display it
+    "fan": "RPM",
+    "load": "%",
+    "clock": "MHz",
+    "power": "W",
+    "voltage": "V",
+    "data": "GB",
+    "smalldata": "MB",
+    "control": "%",
+    "level": "%",
+    "throughput": "KB/s",
+}
+
+# REST API sensor type -> sensor_database category (anything else goes to "other")
+_REST_CATEGORY_MAP = {
+    "temperature": "temperature",
+    "fan": "fan",
+    "load": "load",
+    "clock": "clock",
+    "power": "power",
+    "memory": "system",      # Reclassified memory metrics
+    "data": "data",          # Now only actual network data
+    "smalldata": "data",
+    "throughput": "throughput",
+}
+
+# Sensor properties read during WMI discovery. Passing them to w.Sensor()
+# turns the query into "SELECT Identifier, Name, ... FROM Sensor", so only
+# these columns are marshalled (wmi.query() already uses a forward-only,
+# return-immediately enumerator)
+_WMI_SENSOR_FIELDS = ["Identifier", "Name", "SensorType", "Value"]
+
+# WMI sensor type -> sensor_database category (anything else goes to "other")
+_WMI_CATEGORY_MAP = {
+    "temperature": "temperature",
+    "fan": "fan",
+    "load": "load",
+    "clock": "clock",
+    "power": "power",
+    "data": "data",
+    "throughput": "throughput",
+}
 
 
 def check_rest_api_connectivity(host, port):
     """
     Check if LibreHardwareMonitor REST API is accessible
+    Results are cached for REST_PROBE_MAX_AGE seconds
     Returns: (success, sensor_count, error_message)
     """
-    url = f"http://{host}:{port}/data.json"
+    now = time.monotonic()
+    if (_rest_probe["ts"] is not None and _rest_probe["key"] == (host, port)
+            and now - _rest_probe["ts"] < REST_PROBE_MAX_AGE):
+        return _rest_probe["result"]
 
-    try:
-        req = urllib_request.Request(url, method='GET')
-        req.add_header('User-Agent', 'PC-Stats-Monitor/2.0')
+    result = _probe_rest_api(host, port)
+    _rest_probe["ts"] = time.monotonic()
+    _rest_probe["key"] = (host, port)
+    _rest_probe["result"] = result
+    return result
 
-        with urllib_request.urlopen(req, timeout=3) as response:
-            if response.status == 200:
-                data = response.read().decode('utf-8')
-                root = json.loads(data)
 
-                # Extract sensors from tree structure
-                sensors = extract_sensors_from_tree(root)
+def _probe_rest_api(host, port):
+    """Fetch /data.json once and count its sensors (uncached)"""
+    try:
+        root = _fetch_json(host, port, timeout=3)
 
-                if len(sensors) > 0:
-                    return True, len(sensors), None
-                else:
-                    return False, 0, "REST API returned no sensors"
-            else:
-                return False, 0, f"HTTP {response.status}"
+        # Extract sensors from tree structure
+        sensors = flatten_sensor_tree(root)
+
+        if len(sensors) > 0:
+            return True, len(sensors), None
+        else:
+            return False, 0, "REST API returned no sensors"
 
-    except urllib_error.HTTPError as e:
-        return False, 0, f"HTTP error {e.code}"
-    except urllib_error.URLError as e:
-        return False, 0, f"Connection failed: {e.reason}"
+    except http.client.HTTPException as e:
+        return False, 0, str(e)
+    except OSError as e:
+        return False, 0, f"Connection failed: {e}"
     except json.JSONDecodeError as e:
         return False, 0, f"Invalid JSON response: {e}"
     except Exception as e:
@@ -301,189 +512,174 @@ def discover_sensors_via_http(host, port):
     """
     global sensor_database
 
-    url = f"http://{host}:{port}/data.json"
-
     try:
-        req = urllib_request.Request(url, method='GET')
-        req.add_header('User-Agent', 'PC-Stats-Monitor/2.0')
+        root = _fetch_json(host, port, timeout=5)
+
+        # Extract sensors from tree structure
+        sensors = flatten_sensor_tree(root, with_parent=True)
+
+        # Reset name tracker to ensure fresh unique names
+        reset_generated_names()
 
-        with urllib_request.urlopen(req, timeout=5) as response:
-            if response.status != 200:
-                print(f"  ✗ HTTP error {response.status}")
-                return False
+        sensor_count = 0
+        for sensor in sensors.values():
+            # Map REST API fields to our sensor_database format
+            sensor_id = sensor.get("SensorId", "")
+            sensor_name = sensor.get("Text", "Unknown")
+            sensor_type = sensor.get("Type", "").lower()
+            sensor_value = sensor.get("Value", "0")
+
+            # Skip if missing critical fields
+            if not sensor_id or not sensor_name:
+                continue
+
+            # Parse value from string (e.g., "45.0 °C" -> 45.0)
+            original_value_str = str(sensor_value)
+            try:
+                # Extract numeric value from string like "45.0 °C" or "12.1 %"
+                sensor_value = _parse_value(original_value_str)
+
+                # Normalize throughput to KB/s for ESP32
+                if sensor_type == "throughput":
+                    value_upper = original_value_str.upper()
+                    if "GB/S" in value_upper:
+                        # GB/s → KB/s: multiply by 1024*1024
+                        sensor_value = sensor_value * 1024 * 1024
+                    elif "MB/S" in value_upper:
+                        # MB/s → KB/s: multiply by 1024
+                        sensor_value = sensor_value * 1024
+                    elif "KB/S" in value_upper:
+                        # Already KB/s, no conversion needed
+                        pass
+                    elif "B/S" in value_upper or not any(x in value_upper for x in ['/', 'S']):
+                        # B/s or raw bytes → KB/s: divide by 1024
+                        sensor_value = sensor_value / 1024
+                    # Multiply by 10 to preserve 1 decimal place (ESP32 will divide by 10)
+                    sensor_value = sensor_value * 10
+            except:
+                sensor_value = 0
 
-            data = response.read().decode('utf-8')
-            root = json.loads(data)
+            # Determine unit based on type
+            sensor_unit = _REST_UNIT_MAP.get(sensor_type, "")
 
-            # Extract sensors from tree structure
-            sensors = extract_sensors_from_tree(root)
+            # Generate short name from sensor_id and sensor_name for uniqueness
+            short_name = generate_short_name_from_id(sensor_id, sensor_type, sensor_name)
 
-            # Reset name tracker to ensure fresh unique names
-            reset_generated_names()
+            # Build display name with device context
+            identifier_parts = sensor_id.split('/')
+            parent_hardware = sensor.get("_parent_hardware", "")
 
-            sensor_count = 0
-            for sensor in sensors:
-                # Map REST API fields to our sensor_database format
-                sensor_id = sensor.get("SensorId", "")
-                sensor_name = sensor.get("Text", "Unknown")
-                sensor_type = sensor.get("Type", "").lower()
-                sensor_value = sensor.get("Value", "0")
-
-                # Skip if missing critical fields
-                if not sensor_id or not sensor_name:
-                    continue
-
-                # Parse value from string (e.g., "45.0 °C" -> 45.0)
-                original_value_str = str(sensor_value)
-                try:
-                    # Extract numeric value from string like "45.0 °C" or "12.1 %"
-                    value_match = re.search(r'[-+]?\d*\.?\d+', original_value_str)
-                    if value_match:
-                        sensor_value = float(value_match.group())
-                    else:
-                        sensor_value = 0
-
-                    # Normalize throughput to KB/s for ESP32
-                    if sensor_type == "throughput":
-                        value_upper = original_value_str.upper()
-                        if "GB/S" in value_upper:
-                            # GB/s → KB/s: multiply by 1024*1024
-                            sensor_value = sensor_value * 1024 * 1024
-                        elif "MB/S" in value_upper:
-                            # MB/s → KB/s: multiply by 1024
-                            sensor_value = sensor_value * 1024
-                        elif "KB/S" in value_upper:
-                            # Already KB/s, no conversion needed
-                            pass
-                        elif "B/S" in value_upper or not any(x in value_upper for x in ['/', 'S']):
-                            # B/s or raw bytes → KB/s: divide by 1024
-                            sensor_value = sensor_value / 1024
-                        # Multiply by 10 to preserve 1 decimal place (ESP32 will divide by 10)
-                        sensor_value = sensor_value * 10
-                except:
-                    sensor_value = 0
-
-                # Determine unit based on type
-                unit_map = {
-                    "temperature": "C",  # No degree symbol - OLED can't display it
-                    "fan": "RPM",
-                    "load": "%",
-                    "clock": "MHz",
-                    "power": "W",
-                    "voltage": "V",
-                    "data": "GB",
-                    "smalldata": "MB",
-                    "control": "%",
-                    "level": "%",
-                    "throughput": "KB/s",
-                }
-                sensor_unit = unit_map.get(sensor_type, "")
-
-                # Generate short name from sensor_id and sensor_name for uniqueness
-                short_name = generate_short_name_from_id(sensor_id, sensor_type, sensor_name)
-
-                # Build display name with device context
-                identifier_parts = sensor_id.split('/')
-                parent_hardware = sensor.get("_parent_hardware", "")
-
-                # For network sensors, use parent hardware name (actual NIC name)
-                if "nic" in sensor_id.lower() and parent_hardware:
-                    # Use friendly NIC name instead of GUID
-                    display_name = f"{sensor_name} [{parent_hardware}]"
-                elif len(identifier_parts) > 1:
-                    device_info = identifier_parts[1]
-                    if device_info.lower() not in sensor_name.lower():
-                        display_name = f"{sensor_name} [{device_info}]"
-                    else:
-                        display_name = sensor_name
+            # For network sensors, use parent hardware name (actual NIC name)
+            if "nic" in sensor_id.lower() and parent_hardware:
+                # Use friendly NIC name instead of GUID
+                display_name = f"{sensor_name} [{parent_hardware}]"
+            elif len(identifier_parts) > 1:
+                device_info = identifier_parts[1]
+                if device_info.lower() not in sensor_name.lower():
+                    display_name = f"{sensor_name} [{device_info}]"
                 else:
                     display_name = sensor_name
+            else:
+                display_name = sensor_name
 
-                # Check if this is an active network interface (has traffic)
-                is_active_nic = False
-                if "nic" in sensor_id.lower() and sensor_type == "throughput":
-                    if sensor_value > 0:
-                        is_active_nic = True
-
-                # Reclassify ambiguous types based on device context
-                # Memory metrics are tagged as "data" but should be in "system"
-                device_id_lower = sensor_id.lower()
-                sensor_name_lower = sensor_name.lower()
-
-                if sensor_type in ("data", "smalldata"):
-                    # Check if this is memory-related (not network data)
-                    if ("memory" in device_id_lower or "ram" in device_id_lower or
-                        "vram" in device_id_lower or
-                        ("gpu" in device_id_lower and ("memory" in sensor_name_lower or "vram" in sensor_name_lower))):
-                        # Reclassify memory as system metric
-                        sensor_type = "memory"
-
-                sensor_info = {
-                    "name": short_name,
-                    "display_name": display_name,
-                    "source": "wmi",  # Keep as "wmi" for compatibility
-                    "type": sensor_type,
-                    "unit": sensor_unit,
-                    "wmi_identifier": sensor_id,
-                    "wmi_sensor_name": sensor_name,
-                    "custom_label": "",
-                    "current_value": int(sensor_value),
-                    "is_active_nic": is_active_nic,  # True if network interface has traffic
-                    "parent_hardware": parent_hardware  # Hardware name (useful for NICs)
-                }
-
-                # Categorize sensor — GPU sensors go to dedicated "gpu" category
-                if _is_gpu_sensor(sensor_id):
-                    sensor_database["gpu"].append(sensor_info)
-                elif sensor_type == "temperature":
-                    sensor_database["temperature"].append(sensor_info)
-                elif sensor_type == "fan":
-                    sensor_database["fan"].append(sensor_info)
-                elif sensor_type == "load":
-                    sensor_database["load"].append(sensor_info)
-                elif sensor_type == "clock":
-                    sensor_database["clock"].append(sensor_info)
-                elif sensor_type == "power":
-                    sensor_database["power"].append(sensor_info)
-                elif sensor_type == "memory":  # Reclassified memory metrics
-                    sensor_database["system"].append(sensor_info)
-                elif sensor_type in ("data", "smalldata"):  # Now only actual network data
-                    sensor_database["data"].append(sensor_info)
-                elif sensor_type == "throughput":
-                    sensor_database["throughput"].append(sensor_info)
-                else:
-                    sensor_database["other"].append(sensor_info)
-
-                sensor_count += 1
-
-            if sensor_count > 0:
-                print(f"  ✓ Found {sensor_count} hardware sensors via REST API:")
-                print(f"    - GPU:         {len(sensor_database['gpu'])}")
-                print(f"    - Temperatures: {len(sensor_database['temperature'])}")
-                print(f"    - Fans: {len(sensor_database['fan'])}")
-                print(f"    - Loads: {len(sensor_database['load'])}")
-                print(f"    - Clocks: {len(sensor_database['clock'])}")
-                print(f"    - Power: {len(sensor_database['power'])}")
-                print(f"    - Data: {len(sensor_database['data'])}")
-                print(f"    - Throughput: {len(sensor_database['throughput'])}")
-                if len(sensor_database['other']) > 0:
-                    print(f"    - Other: {len(sensor_database['other'])}")
-                return True
+            # Check if this is an active network interface (has traffic)
+            is_active_nic = False
+            if "nic" in sensor_id.lower() and sensor_type == "throughput":
+                if sensor_value > 0:
+                    is_active_nic = True
+
+            # Reclassify ambiguous types based on device context
+            # Memory metrics are tagged as "data" but should be in "system"
+            device_id_lower = sensor_id.lower()
+            sensor_name_lower = sensor_name.lower()
+
+            if sensor_type in ("data", "smalldata"):
+                # Check if this is memory-related (not network data)
+                if ("memory" in device_id_lower or "ram" in device_id_lower or
+                    "vram" in device_id_lower or
+                    ("gpu" in device_id_lower and ("memory" in sensor_name_lower or "vram" in sensor_name_lower))):
+                    # Reclassify memory as system metric
+                    sensor_type = "memory"
+
+            sensor_info = {
+                "name": short_name,
+                "display_name": display_name,
+                "source": "wmi",  # Keep as "wmi" for compatibility
+                "type": sensor_type,
+                "unit": sensor_unit,
+                "wmi_identifier": sensor_id,
+                "wmi_sensor_name": sensor_name,
+                "custom_label": "",
+                "current_value": int(sensor_value),
+                "is_active_nic": is_active_nic,  # True if network interface has traffic
+                "parent_hardware": parent_hardware  # Hardware name (useful for NICs)
+            }
+
+            # Categorize sensor — GPU sensors go to dedicated "gpu" category
+            if _is_gpu_sensor(sensor_id):
+                category = "gpu"
             else:
-                print("  ⚠ REST API returned 0 sensors")
-                return False
+                category = _REST_CATEGORY_MAP.get(sensor_type, "other")
+            sensor_database[category].append(sensor_info)
+
+            sensor_count += 1
+
+        if sensor_count > 0:
+            print(f"  ✓ Found {sensor_count} hardware sensors via REST API:")
+            print(f"    - GPU:         {len(sensor_database['gpu'])}")
+            print(f"    - Temperatures: {len(sensor_database['temperature'])}")
+            print(f"    - Fans: {len(sensor_database['fan'])}")
+            print(f"    - Loads: {len(sensor_database['load'])}")
+            print(f"    - Clocks: {len(sensor_database['clock'])}")
+            print(f"    - Power: {len(sensor_database['power'])}")
+            print(f"    - Data: {len(sensor_database['data'])}")
+            print(f"    - Throughput: {len(sensor_database['throughput'])}")
+            if len(sensor_database['other']) > 0:
+                print(f"    - Other: {len(sensor_database['other'])}")
+            return True
+        else:
+            print("  ⚠ REST API returned 0 sensors")
+            return False
 
-    except urllib_error.HTTPError as e:
-        print(f"  ✗ HTTP error {e.code}")
+    except http.client.HTTPException as e:
+        print(f"  ✗ {e}")
         return False
-    except urllib_error.URLError as e:
-        print(f"  ✗ Connection failed: {e.reason}")
+    except OSError as e:
+        print(f"  ✗ Connection failed: {e}")
         return False
     except Exception as e:
         print(f"  ✗ Error: {e}")
         return False
 
 
+def refresh_rest_snapshot(host, port, max_age=None):
+    """
+    Fetch /data.json at most once per max_age seconds and index the sensors
+    by SensorId, so all metrics of one polling tick share one request.
+    A failed fetch is kept for max_age too, so the remaining metrics don't
+    each wait for the timeout again.
+    Returns: True if the snapshot holds data from a successful fetch
+    """
+    if max_age is None:
+        max_age = REST_SNAPSHOT_MAX_AGE
+
+    now = time.monotonic()
+    if _rest_snapshot["ts"] is not None and now - _rest_snapshot["ts"] < max_age:
+        return _rest_snapshot["ok"]
+    _rest_snapshot["ts"] = now
+
+    try:
+        # 1s timeout for fast failure detection
+        root = _fetch_json(host, port, timeout=1)
+        _rest_snapshot["by_id"] = flatten_sensor_tree(root)
+        _rest_snapshot["ok"] = True
+    except Exception:
+        _rest_snapshot["by_id"] = {}
+        _rest_snapshot["ok"] = False
+
+    return _rest_snapshot["ok"]
+
+
 def get_metric_value_via_http(metric_config, host, port):
     """
     Get sensor value via LibreHardwareMonitor REST API
@@ -497,68 +693,48 @@ def get_metric_value_via_http(metric_config, host, port):
     if not sensor_id:
         return None
 
-    url = f"http://{host}:{port}/data.json"
     is_throughput = metric_config.get("unit", "") == "KB/s"
 
-    try:
-        req = urllib_request.Request(url, method='GET')
-        req.add_header('User-Agent', 'PC-Stats-Monitor/2.0')
-
-        with urllib_request.urlopen(req, timeout=1) as response:  # 1s timeout for fast failure detection
-            if response.status != 200:
-                lhm_health_monitor.record_failure()
-                return None
-
-            data = response.read().decode('utf-8')
-            root = json.loads(data)
-
-            # Extract sensors from tree structure
-            sensors = extract_sensors_from_tree(root)
-
-            # Find matching sensor by SensorId
-            for sensor in sensors:
-                if sensor.get("SensorId", "") == sensor_id:
-                    value = sensor.get("Value", "0")
-                    value_str = str(value)
-                    # Parse value from string (e.g., "45.0 °C" -> 45.0)
-                    try:
-                        value_match = re.search(r'[-+]?\d*\.?\d+', value_str)
-                        if value_match:
-                            float_value = float(value_match.group())
-                            # For throughput: multiply by 10 to preserve 1 decimal place
-                            # ESP32 will divide by 10 when displaying
-                            if is_throughput:
-                                # Normalize throughput to KB/s for ESP32
-                                value_upper = value_str.upper()
-                                if "GB/S" in value_upper:
-                                    # GB/s → KB/s
-                                    float_value = float_value * 1024 * 1024
-                                elif "MB/S" in value_upper:
-                                    # MB/s → KB/s
-                                    float_value = float_value * 1024
-                                elif "KB/S" in value_upper:
-                                    # Already KB/s
-                                    pass
-                                elif "B/S" in value_upper or not any(x in value_upper for x in ['/', 'S']):
-                                    # B/s or raw bytes → KB/s
-                                    float_value = float_value / 1024
-                                float_value = float_value * 10
-                            lhm_health_monitor.record_success()
-                            return int(float_value)
-                    except:
-                        pass
-                    # Sensor found but value parsing failed
-                    lhm_health_monitor.record_success()  # API is working
-                    return 0
-
-            # Sensor not found in response
-            lhm_health_monitor.record_success()  # API is working
-            return 0
-
-    except Exception:
+    if not refresh_rest_snapshot(host, port):
         lhm_health_monitor.record_failure()
         return None
 
+    sensor = _rest_snapshot["by_id"].get(sensor_id)
+    if sensor is None:
+        # Sensor not found in response
+        lhm_health_monitor.record_success()  # API is working
+        return 0
+
+    value_str = str(sensor.get("Value", "0"))
+    # Parse value from string (e.g., "45.0 °C" -> 45.0)
+    try:
+        float_value = _parse_value(value_str)
+        # For throughput: multiply by 10 to preserve 1 decimal place
+        # ESP32 will divide by 10 when displaying
+        if is_throughput:
+            # Normalize throughput to KB/s for ESP32
+            value_upper = value_str.upper()
+            if "GB/S" in value_upper:
+                # GB/s → KB/s
+                float_value = float_value * 1024 * 1024
+            elif "MB/S" in value_upper:
+                # MB/s → KB/s
+                float_value = float_value * 1024
+            elif "KB/S" in value_upper:
+                # Already KB/s
+                pass
+            elif "B/S" in value_upper or not any(x in value_upper for x in ['/', 'S']):
+                # B/s or raw bytes → KB/s
+                float_value = float_value / 1024
+            float_value = float_value * 10
+        lhm_health_monitor.record_success()
+        return int(float_value)
+    except:
+        pass
+    # Sensor found but value parsing failed
+    lhm_health_monitor.record_success()  # API is working
+    return 0
+
 
 # Global tracker for generated names to ensure uniqueness
 _generated_names = set()
@@ -626,6 +802,19 @@ def generate_short_name_from_id(sensor_id, sensor_type, sensor_name=""):
     Generate unique short name from sensor_id and sensor_name (REST API format)
     Uses sensor_name context to differentiate similar sensors
     """
+    base = _short_name_base_from_id(sensor_id, sensor_type, sensor_name)
+    if base is None:
+        return None
+    return _make_unique_name(base)
+
+
+@functools.lru_cache(maxsize=4096)
+def _short_name_base_from_id(sensor_id, sensor_type, sensor_name=""):
+    """
+    Derive the (not yet unique) base short name for a sensor.
+    Pure function of its arguments, so results are memoized across
+    re-discoveries; uniqueness is applied by generate_short_name_from_id.
+    """
     parts = sensor_id.split('/')
     name_lower = sensor_name.lower()
 
@@ -671,7 +860,7 @@ def generate_short_name_from_id(sensor_id, sensor_type, sensor_name=""):
                 base = f"CPUCLK{sensor_idx}" if sensor_idx != "0" else "CPUCLK"
             else:
                 base = f"CPU_{sensor_idx}"
-            return _make_unique_name(base)
+            return base
 
         # GPU sensors
         elif "gpu" in device_lower or "nvidia" in device_lower or "amd" in device_lower:
@@ -704,7 +893,7 @@ def generate_short_name_from_id(sensor_id, sensor_type, sensor_name=""):
                 base = f"VRAM{gpu_idx}{context}"
             else:
                 base = f"GPU{gpu_idx}_{sensor_idx}"
-            return _make_unique_name(base)
+            return base
 
         # LPC/Motherboard sensors (VRM, PCH, System temps, etc.)
         elif "lpc" in device_lower or "motherboard" in device_lower or "mainboard" in device_lower:
@@ -763,7 +952,7 @@ def generate_short_name_from_id(sensor_id, sensor_type, sensor_name=""):
                 base = f"CTL{sensor_idx}"
             else:
                 base = f"LPC{sensor_idx}"
-            return _make_unique_name(base)
+            return base
 
         # Memory/RAM sensors
         elif "memory" in device_lower or "ram" in device_lower:
@@ -782,7 +971,7 @@ def generate_short_name_from_id(sensor_id, sensor_type, sensor_name=""):
                 base = "RAM"
             else:
                 base = f"RAM{sensor_idx}"
-            return _make_unique_name(base)
+            return base
 
         # Network sensors
         elif "nic" in device_lower or "network" in device_lower:
@@ -807,7 +996,7 @@ def generate_short_name_from_id(sensor_id, sensor_type, sensor_name=""):
                     base = f"NTD{net_idx}_{sensor_idx}"
             else:
                 base = f"NET{net_idx}_{sensor_idx}"
-            return _make_unique_name(base)
+            return base
 
         # Storage (HDD/SSD/NVMe)
         elif "hdd" in device_lower or "ssd" in device_lower or "nvme" in device_lower:
@@ -827,7 +1016,7 @@ def generate_short_name_from_id(sensor_id, sensor_type, sensor_name=""):
                 base = f"{prefix}D"
             else:
                 base = f"{prefix}_{sensor_idx}"
-            return _make_unique_name(base)
+            return base
 
     # Fallback: Create descriptive name from sensor_name + sensor_id
     if sensor_name:
@@ -838,12 +1027,12 @@ def generate_short_name_from_id(sensor_id, sensor_type, sensor_name=""):
             type_suffix = {"temperature": "T", "fan": "F", "load": "%",
                           "power": "W", "voltage": "V", "clock": "C"}.get(sensor_type, "")
             base = f"{base}{type_suffix}"
-            return _make_unique_name(base)
+            return base
 
     # Last resort fallback
     if len(parts) >= 2:
         device = parts[1].replace("-", "")[:4].upper()
-        return _make_unique_name(f"{device}{sensor_idx}")
+        return f"{device}{sensor_idx}"
 
 
 def _is_gpu_sensor(identifier):
@@ -867,6 +1056,17 @@ def check_wmi_connectivity():
     Diagnostics: Check if LibreHardwareMonitor WMI namespace is accessible
     Returns: (success, error_message, suggestion)
     """
+    # The process scan and REST API probe don't depend on WMI, so run them in
+    # the background while the WMI checks run here; the pool waits for both
+    # before returning so the REST connection is never shared across threads
+    with concurrent.futures.ThreadPoolExecutor(max_workers=2) as executor:
+        lhm_proc_future = executor.submit(_find_lhm_process)
+        rest_future = executor.submit(check_rest_api_connectivity, rest_api_host, rest_api_port)
+        return _run_connectivity_checks(lhm_proc_future, rest_future)
+
+
+def _run_connectivity_checks(lhm_proc_future, rest_future):
+    """Print the WMI/REST diagnostics using the background check results"""
     print("\n" + "-" * 60)
     print("DIAGNOSTICS: Checking LibreHardwareMonitor connectivity...")
     print("-" * 60)
@@ -887,23 +1087,14 @@ def check_wmi_connectivity():
     # Check 2: Verify LibreHardwareMonitor process is running
     print("\n[Check 2/4] Checking if LibreHardwareMonitor is running...")
     try:
-        import psutil
-        found_lhm = False
-        lhm_names = ["librehardwaremonitor", "libre hardware monitor",
-                     "hwmonitor", "hardware monitor"]
-        for proc in psutil.process_iter(['name']):
-            try:
-                proc_name = proc.info['name'].lower()
-                if any(name in proc_name for name in lhm_names):
-                    found_lhm = True
-                    print(f"  ✓ Found LibreHardwareMonitor process: {proc.info['name']}")
-                    break
-            except (psutil.NoSuchProcess, psutil.AccessDenied):
-                pass
+        lhm_proc = lhm_proc_future.result()
+        found_lhm = lhm_proc is not None
+        if found_lhm:
+            print(f"  ✓ Found LibreHardwareMonitor process: {lhm_proc['name']}")
 
         # Try to detect version if process is running
         if found_lhm:
-            version = get_librehardwaremonitor_version()
+            version = get_librehardwaremonitor_version(lhm_proc)
             if version:
                 print(f"  → Detected LibreHardwareMonitor version: {version}")
                 # Check for known problematic versions
@@ -951,7 +1142,7 @@ def check_wmi_connectivity():
         print(f"  → Checking http://{rest_api_host}:{rest_api_port}/data.json")
 
         global use_rest_api
-        rest_success, rest_count, rest_error = check_rest_api_connectivity(rest_api_host, rest_api_port)
+        rest_success, rest_count, rest_error = rest_future.result()
 
         # Debug: print REST API check result
         if rest_error:
@@ -985,7 +1176,7 @@ def check_wmi_connectivity():
     try:
         import wmi
         w = wmi.WMI(namespace=discovered_wmi_namespace)
-        sensors = list(w.Sensor())
+        sensors = list(w.Sensor(["Identifier"]))
 
         if len(sensors) == 0:
             # CRITICAL: Namespace exists but no sensors found
@@ -993,7 +1184,7 @@ def check_wmi_connectivity():
             print(f"  ⚠ WMI returned 0 sensors - trying REST API fallback...")
             print(f"  → Checking http://{rest_api_host}:{rest_api_port}/data.json")
 
-            rest_success, rest_count, rest_error = check_rest_api_connectivity(rest_api_host, rest_api_port)
+            rest_success, rest_count, rest_error = rest_future.result()
 
             if rest_success and rest_count > 0:
                 # REST API works! Use it instead of WMI
@@ -1076,6 +1267,8 @@ def discover_sensors():
         "current_value": int(psutil.cpu_percent(interval=0))
     })
 
+    # One memory snapshot serves both RAM metrics
+    vm = psutil.virtual_memory()
     sensor_database["system"].append({
         "name": "RAM",
         "display_name": "RAM Usage",
@@ -1084,7 +1277,7 @@ def discover_sensors():
         "unit": "%",
         "psutil_method": "virtual_memory.percent",
         "custom_label": "",
-        "current_value": int(psutil.virtual_memory().percent)
+        "current_value": int(vm.percent)
     })
 
     sensor_database["system"].append({
@@ -1095,7 +1288,7 @@ def discover_sensors():
         "unit": "GB",
         "psutil_method": "virtual_memory.used",
         "custom_label": "",
-        "current_value": int(psutil.virtual_memory().used / (1024**3))
+        "current_value": int(vm.used / (1024**3))
     })
 
     sensor_database["system"].append({
@@ -1141,71 +1334,81 @@ def discover_sensors():
         import wmi
         # Use the auto-discovered namespace
         w = wmi.WMI(namespace=discovered_wmi_namespace)
-        sensors = w.Sensor()
+        sensors = w.Sensor(_WMI_SENSOR_FIELDS)
 
         sensor_count = 0
         # Reset name tracker to ensure fresh unique names
         reset_generated_names()
 
         for sensor in sensors:
+            # Read each COM property once - every attribute access is a COM round-trip
+            sensor_id = sensor.Identifier
+            sensor_name = sensor.Name
+            sensor_type = sensor.SensorType
+            sensor_type_lower = sensor_type.lower()
+            raw_value = sensor.Value
+
             # Generate short name for ESP32 display (using same function as REST API)
-            short_name = generate_short_name_from_id(sensor.Identifier, sensor.SensorType.lower(), sensor.Name)
+            short_name = generate_short_name_from_id(sensor_id, sensor_type_lower, sensor_name)
 
             # Enhance display name with identifier context for GUI
-            display_name = sensor.Name
-            identifier_parts = sensor.Identifier.split('/')
+            display_name = sensor_name
+            identifier_parts = sensor_id.split('/')
             if len(identifier_parts) > 1:
                 device_info = identifier_parts[1]
+                device_info_lower = device_info.lower()
                 # Add device context to display name for clarity
-                if device_info.lower() not in display_name.lower():
-                    display_name = f"{sensor.Name} [{device_info}]"
+                if device_info_lower not in display_name.lower():
+                    display_name = f"{sensor_name} [{device_info}]"
+
+                # Only network adapters need upload/download disambiguation
+                is_network = 'nic' in device_info_lower or 'network' in device_info_lower
 
                 # Special handling for network data metrics (upload/download disambiguation)
-                if sensor.SensorType.lower() == "data" and ('nic' in device_info.lower() or 'network' in device_info.lower()):
+                if is_network and sensor_type_lower == "data":
                     # Extract data metric index to distinguish upload/download
                     # /nic/0/data/0 = Download, /nic/0/data/1 = Upload, etc.
                     if len(identifier_parts) >= 4:
                         data_index = identifier_parts[-1]
 
                         # Check if name already has Upload/Download
-                        name_lower = sensor.Name.lower()
+                        name_lower = sensor_name.lower()
                         if 'upload' not in name_lower and 'download' not in name_lower and 'rx' not in name_lower and 'tx' not in name_lower:
                             # Add Upload/Download based on data index
                             if data_index == '0':
-                                display_name = f"{sensor.Name} - Download [{device_info}]"
+                                display_name = f"{sensor_name} - Download [{device_info}]"
                             elif data_index == '1':
-                                display_name = f"{sensor.Name} - Upload [{device_info}]"
+                                display_name = f"{sensor_name} - Upload [{device_info}]"
                             else:
-                                display_name = f"{sensor.Name} #{data_index} [{device_info}]"
+                                display_name = f"{sensor_name} #{data_index} [{device_info}]"
 
                 # Special handling for network throughput metrics (upload/download disambiguation)
-                elif sensor.SensorType.lower() == "throughput" and ('nic' in device_info.lower() or 'network' in device_info.lower()):
+                elif is_network and sensor_type_lower == "throughput":
                     # Extract throughput metric index to distinguish upload/download
                     # /nic/0/throughput/0 = Upload Speed, /nic/0/throughput/1 = Download Speed
                     if len(identifier_parts) >= 4:
                         throughput_index = identifier_parts[-1]
 
                         # Check if name already has Upload/Download
-                        name_lower = sensor.Name.lower()
+                        name_lower = sensor_name.lower()
                         if 'upload' not in name_lower and 'download' not in name_lower and 'rx' not in name_lower and 'tx' not in name_lower:
                             # Add Upload/Download based on throughput index
                             if throughput_index == '0':
-                                display_name = f"{sensor.Name} - Upload [{device_info}]"
+                                display_name = f"{sensor_name} - Upload [{device_info}]"
                             elif throughput_index == '1':
-                                display_name = f"{sensor.Name} - Download [{device_info}]"
+                                display_name = f"{sensor_name} - Download [{device_info}]"
                             else:
-                                display_name = f"{sensor.Name} #{throughput_index} [{device_info}]"
+                                display_name = f"{sensor_name} #{throughput_index} [{device_info}]"
 
             # Get current sensor value
             try:
-                current_value = int(sensor.Value) if sensor.Value else 0
-            except:
+                current_value = int(raw_value) if raw_value else 0
+            except (TypeError, ValueError, OverflowError):
                 current_value = 0
 
             # Check if this is an active network interface (has traffic)
             is_active_nic = False
-            sensor_type_lower = sensor.SensorType.lower()
-            if "nic" in sensor.Identifier.lower() and sensor_type_lower == "throughput":
+            if "nic" in sensor_id.lower() and sensor_type_lower == "throughput":
                 if current_value > 0:
                     is_active_nic = True
 
@@ -1214,42 +1417,21 @@ def discover_sensors():
                 "display_name": display_name,
                 "source": "wmi",
                 "type": sensor_type_lower,
-                "unit": get_unit_from_type(sensor.SensorType),
-                "wmi_identifier": sensor.Identifier,
-                "wmi_sensor_name": sensor.Name,
+                "unit": get_unit_from_type(sensor_type),
+                "wmi_identifier": sensor_id,
+                "wmi_sensor_name": sensor_name,
                 "custom_label": "",
                 "current_value": current_value,
                 "is_active_nic": is_active_nic
             }
 
             # Categorize sensor — GPU sensors go to dedicated "gpu" category
-            if _is_gpu_sensor(sensor.Identifier):
-                sensor_database["gpu"].append(sensor_info)
-                sensor_count += 1
-            elif sensor_type_lower == "temperature":
-                sensor_database["temperature"].append(sensor_info)
-                sensor_count += 1
-            elif sensor_type_lower == "fan":
-                sensor_database["fan"].append(sensor_info)
-                sensor_count += 1
-            elif sensor_type_lower == "load":
-                sensor_database["load"].append(sensor_info)
-                sensor_count += 1
-            elif sensor_type_lower == "clock":
-                sensor_database["clock"].append(sensor_info)
-                sensor_count += 1
-            elif sensor_type_lower == "power":
-                sensor_database["power"].append(sensor_info)
-                sensor_count += 1
-            elif sensor_type_lower == "data":
-                sensor_database["data"].append(sensor_info)
-                sensor_count += 1
-            elif sensor_type_lower == "throughput":
-                sensor_database["throughput"].append(sensor_info)
-                sensor_count += 1
+            if _is_gpu_sensor(sensor_id):
+                category = "gpu"
             else:
-                sensor_database["other"].append(sensor_info)
-                sensor_count += 1
+                category = _WMI_CATEGORY_MAP.get(sensor_type_lower, "other")
+            sensor_database[category].append(sensor_info)
+            sensor_count += 1
 
         print(f"  Found {sensor_count} hardware sensors:")
         print(f"    - GPU:          {len(sensor_database['gpu'])}")
@@ -1292,8 +1474,11 @@ def generate_short_name(full_name, sensor_type, identifier=""):
     device_prefix = ""
     device_index = ""
 
+    # Split the identifier and lowercase the type once; the branches below reuse them
+    parts = identifier.split('/') if identifier else []
+    st = sensor_type.lower()
+
     if identifier:
-        parts = identifier.split('/')
         if len(parts) > 1:
             device = parts[1].lower()
 
@@ -1328,7 +1513,7 @@ def generate_short_name(full_name, sensor_type, identifier=""):
     name = full_name.strip()
 
     # For temperature sensors, add device prefix
-    if sensor_type.lower() == "temperature":
+    if st == "temperature":
         # Remove "Temperature" word
         name = name.replace("Temperature", "").replace("temperature", "").strip()
         # Add device prefix if not already there
@@ -1336,35 +1521,35 @@ def generate_short_name(full_name, sensor_type, identifier=""):
             name = device_prefix + device_index + "_" + name if device_index else device_prefix + name
 
     # For fans, preserve numbers and context
-    elif sensor_type.lower() == "fan":
+    elif st == "fan":
         # Keep "Fan #1" as "FAN1", "Pump" as "PUMP", etc.
         name = name.replace("Fan #", "FAN").replace("fan #", "FAN")
         name = name.replace("Chassis", "CHS").replace("System", "SYS")
 
     # For loads, add context
-    elif sensor_type.lower() == "load":
+    elif st == "load":
         name = name.replace("Load", "").strip()
         if device_prefix:
             name = device_prefix + device_index + "_" + name if device_index else device_prefix + name
 
     # For power
-    elif sensor_type.lower() == "power":
+    elif st == "power":
         name = name.replace("Package", "PKG").replace("Power", "").strip()
         if device_prefix:
             name = device_prefix + device_index + "_" + name if device_index else device_prefix + name
 
     # For data (network/disk usage)
-    elif sensor_type.lower() == "data":
+    elif st == "data":
         name = name.replace("Data", "").strip()
         if device_prefix:
             name = device_prefix + device_index + "_" + name if device_index else device_prefix + name
 
         # For network metrics, add Upload/Download suffix if not already in name
         if device_prefix == "NET" and identifier:
-            parts = identifier.split('/')
             name_lower = name.lower()
+            last_segment = name_lower.rsplit('_', 1)[-1]
             # Check if upload/download not already specified
-            if 'upload' not in name_lower and 'download' not in name_lower and 'u' not in name_lower.split('_')[-1] and 'd' not in name_lower.split('_')[-1]:
+            if 'upload' not in name_lower and 'download' not in name_lower and 'u' not in last_segment and 'd' not in last_segment:
                 # Extract data metric index: /nic/0/data/0 = Download, /nic/0/data/1 = Upload
                 if len(parts) >= 4:
                     data_index = parts[-1]
@@ -1374,17 +1559,17 @@ def generate_short_name(full_name, sensor_type, identifier=""):
                         name = name + "_U"  # Upload
 
     # For throughput (network speeds)
-    elif sensor_type.lower() == "throughput":
+    elif st == "throughput":
         name = name.replace("Speed", "").strip()
         if device_prefix:
             name = device_prefix + device_index + "_" + name if device_index else device_prefix + name
 
         # For network throughput, add Upload/Download suffix
         if device_prefix == "NET" and identifier:
-            parts = identifier.split('/')
             name_lower = name.lower()
+            last_segment = name_lower.rsplit('_', 1)[-1]
             # Check if upload/download not already specified
-            if 'upload' not in name_lower and 'download' not in name_lower and 'u' not in name_lower.split('_')[-1] and 'd' not in name_lower.split('_')[-1]:
+            if 'upload' not in name_lower and 'download' not in name_lower and 'u' not in last_segment and 'd' not in last_segment:
                 # Extract throughput metric index: /nic/0/throughput/0 = Upload, /nic/0/throughput/1 = Download
                 if len(parts) >= 4:
                     throughput_index = parts[-1]
@@ -1480,10 +1665,25 @@ def load_config():
 def save_config(config):
     """
     Save configuration to file
+    Skipped when the file already holds the same content; otherwise written to
+    a temp file and swapped in with os.replace so a crash can't truncate it
     """
     try:
-        with open(CONFIG_FILE, 'w') as f:
-            json.dump(config, f, indent=2)
+        data = json.dumps(config, indent=2)
+        try:
+            with open(CONFIG_FILE, 'r') as f:
+                if f.read() == data:
+                    print(f"\n✓ Configuration unchanged ({CONFIG_FILE})")
+                    return True
+        except (OSError, ValueError):
+            pass  # No readable existing config - write a new one
+
+        tmp_path = CONFIG_FILE + ".tmp"
+        with open(tmp_path, 'w') as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, CONFIG_FILE)
         print(f"\n✓ Configuration saved to {CONFIG_FILE}")
         return True
     except Exception as e:
@@ -1491,18 +1691,25 @@ def save_config(config):
         return False
 
 
-def setup_autostart(enable=True):
+@functools.lru_cache(maxsize=None)
+def _autostart_shortcut_path():
     """
-    Add/remove script to Windows startup folder
+    Path of the autostart shortcut in the Windows startup folder
+    Resolved once per session (raises if winshell is not installed)
     """
     import winshell
-    from win32com.client import Dispatch
+    return os.path.join(winshell.startup(), "PC Monitor.lnk")
 
-    startup_folder = winshell.startup()
-    shortcut_path = os.path.join(startup_folder, "PC Monitor.lnk")
+
+def setup_autostart(enable=True):
+    """
+    Add/remove script to Windows startup folder
+    """
+    shortcut_path = _autostart_shortcut_path()
 
     if enable:
-        # Create shortcut
+        # Create shortcut (WScript.Shell is only needed here; removal is a plain file delete)
+        from win32com.client import Dispatch
         shell = Dispatch('WScript.Shell')
         shortcut = shell.CreateShortCut(shortcut_path)
 
@@ -1536,10 +1743,22 @@ def setup_autostart(enable=True):
 # AutoConfigPreviewDialog class removed - will be revisited later
 
 
+def _sensor_key(sensor):
+    """
+    Stable key for a discovered sensor in the configuration GUI
+    Uses wmi_identifier (sensor path) - most reliable and unique
+    """
+    return sensor.get('wmi_identifier') or f"{sensor['source']}_{sensor['display_name']}"
+
+
 class MetricSelectorGUI:
     """
     Tkinter GUI for selecting metrics and configuring settings
     """
+    # Approximate pixel height of one sensor row (checkbox + label entry),
+    # used to size a category before its rows are built
+    SENSOR_ROW_HEIGHT = 48
+
     def __init__(self, root, existing_config=None):
         self.root = root
         self.root.title("PC Monitor v2.0 - Configuration")
@@ -1547,8 +1766,17 @@ class MetricSelectorGUI:
         self.root.resizable(False, False)
 
         self.selected_metrics = []
-        self.checkboxes = []
-        self.label_entries = {}
+        self.selected_keys = set()  # _sensor_key() of each entry in selected_metrics
+        self.rows = []  # (sensor, var) for every discovered sensor, built or not
+        self.checkboxes = []  # Built rows only
+        self.search_texts = []  # Lowercased "display_name\0name" per checkbox, for on_search
+        self.search_matches = []  # Highlight applied per checkbox (None = not styled yet)
+        self.label_entries = {}  # Built rows only
+        self.custom_labels = {}  # sensor_key -> custom label text, kept for unbuilt rows too
+        self.pending_categories = []  # (cat_frame, placeholder, rows) not yet built
+        self._search_term = None
+        self._search_after = None
+        self._refresh_pending = False
 
         # Load existing config if available
         if existing_config:
@@ -1602,11 +1830,12 @@ class MetricSelectorGUI:
         autostart_frame = tk.Frame(settings_frame, bg="#2d2d2d")
         autostart_frame.grid(row=1, column=1, columnspan=2, padx=5, pady=3, sticky="w")
 
+        status_text, status_color = self.get_autostart_state()
         self.autostart_status = tk.Label(
             autostart_frame,
-            text=self.get_autostart_status_text(),
+            text=status_text,
             bg="#2d2d2d",
-            fg=self.get_autostart_status_color(),
+            fg=status_color,
             font=("Arial", 10, "bold")
         )
         self.autostart_status.pack(side=tk.LEFT, padx=5)
@@ -1656,7 +1885,7 @@ class MetricSelectorGUI:
         search_label.pack(side=tk.LEFT, padx=(50, 5))
 
         self.search_var = tk.StringVar()
-        self.search_var.trace_add('write', lambda *_: self.on_search())
+        self.search_var.trace_add('write', self.schedule_search)
         search_entry = tk.Entry(counter_frame, textvariable=self.search_var, width=20)
         search_entry.pack(side=tk.LEFT, padx=5)
 
@@ -1697,11 +1926,17 @@ class MetricSelectorGUI:
 
         # Create window that fills canvas width
         canvas_window = canvas.create_window((0, 0), window=scrollable_frame, anchor="nw")
-        canvas.configure(yscrollcommand=scrollbar.set)
+
+        # Build sensor rows as their category scrolls into view
+        def on_yscroll(first, last):
+            scrollbar.set(first, last)
+            self.schedule_visible_refresh()
+        canvas.configure(yscrollcommand=on_yscroll)
 
         # Make scrollable_frame fill canvas width
         def on_canvas_configure(event):
             canvas.itemconfig(canvas_window, width=event.width)
+            self.schedule_visible_refresh()
         canvas.bind("<Configure>", on_canvas_configure)
 
         # Mouse wheel scrolling
@@ -1772,63 +2007,15 @@ class MetricSelectorGUI:
             cat_frame.bind("<MouseWheel>", on_mousewheel)
             cat_label.bind("<MouseWheel>", on_mousewheel)
 
-            # Sensors in category
-            for sensor in sensor_database[cat_key]:
-                var = tk.BooleanVar()
-
-                # Highlight active network interfaces
-                is_active = sensor.get('is_active_nic', False)
-                if is_active:
-                    frame_bg = "#d4ffd4"  # Light green background
-                    text_color = "#006600"  # Dark green text
-                    active_marker = " ★"  # Star to mark active
-                else:
-                    frame_bg = "#f0f0f0"
-                    text_color = "#000000"
-                    active_marker = ""
-
-                # Create sensor row frame
-                sensor_frame = tk.Frame(cat_frame, bg=frame_bg)
-                sensor_frame.pack(fill=tk.X, padx=10, pady=2)
-
-                # Checkbox with current value
-                value_text = f" - {sensor['current_value']}{sensor['unit']}" if sensor.get('current_value') is not None else ""
-                cb = tk.Checkbutton(
-                    sensor_frame,
-                    text=f"{sensor['display_name']} ({sensor['name']}){value_text}{active_marker}",
-                    variable=var,
-                    bg=frame_bg,
-                    fg=text_color,
-                    selectcolor="#ffffff",
-                    anchor="w",
-                    command=lambda s=sensor, v=var: self.on_checkbox_toggle(s, v)
-                )
-                cb.pack(side=tk.TOP, fill=tk.X)
-
-                # Custom label entry (small, below checkbox)
-                label_frame = tk.Frame(sensor_frame, bg=frame_bg)
-                label_frame.pack(side=tk.TOP, fill=tk.X, padx=20)
-
-                tk.Label(label_frame, text="Label:", bg=frame_bg, fg="#666", font=("Arial", 8)).pack(side=tk.LEFT)
-                label_entry = tk.Entry(label_frame, width=15, font=("Arial", 8))
-                label_entry.pack(side=tk.LEFT, padx=5)
-
-                # Update preview when label text changes
-                label_entry.bind("<KeyRelease>", lambda e: self.update_counter())
-
-                # Store reference to label entry and label frame
-                # Use wmi_identifier (sensor path) as key - most reliable and unique
-                sensor_key = sensor.get('wmi_identifier') or f"{sensor['source']}_{sensor['display_name']}"
-                self.label_entries[sensor_key] = {
-                    'entry': label_entry,
-                    'frame': label_frame
-                }
-
-                # Bind mousewheel to all created widgets
-                for widget in [sensor_frame, cb, label_frame, label_entry]:
-                    widget.bind("<MouseWheel>", on_mousewheel)
-
-                self.checkboxes.append((cb, sensor, var, sensor_frame))
+            # Sensors in category - only a sized placeholder for now, the
+            # rows themselves are built by refresh_visible_categories()
+            sensors = sensor_database[cat_key]
+            for sensor in sensors:
+                self.rows.append((sensor, tk.BooleanVar()))
+            placeholder = tk.Frame(cat_frame, bg="#f0f0f0", height=len(sensors) * self.SENSOR_ROW_HEIGHT)
+            placeholder.pack(fill=tk.X, padx=10, pady=2)
+            placeholder.bind("<MouseWheel>", on_mousewheel)
+            self.pending_categories.append((cat_frame, placeholder, self.rows[-len(sensors):]))
 
         # Preview frame
         preview_frame = tk.Frame(self.root, bg="#2d2d2d", height=40)
@@ -1889,36 +2076,149 @@ class MetricSelectorGUI:
         # Update counter
         self.update_counter()
 
+    def schedule_visible_refresh(self):
+        """Coalesce scroll/resize events into one refresh_visible_categories() call"""
+        if self._refresh_pending or not self.pending_categories:
+            return
+        self._refresh_pending = True
+        self.root.after_idle(self.refresh_visible_categories)
+
+    def refresh_visible_categories(self):
+        """Build the sensor rows of every category within one screen of the viewport"""
+        self._refresh_pending = False
+        canvas = self.canvas
+        height = canvas.winfo_height()
+        top = canvas.canvasy(0) - height
+        bottom = canvas.canvasy(0) + 2 * height
+
+        still_pending = []
+        for cat_frame, placeholder, rows in self.pending_categories:
+            # cat_frame sits in a column frame, which sits in scrollable_frame
+            cat_y = cat_frame.master.winfo_y() + cat_frame.winfo_y()
+            if cat_y <= bottom and cat_y + cat_frame.winfo_height() >= top:
+                placeholder.destroy()
+                for sensor, var in rows:
+                    self.build_sensor_row(cat_frame, sensor, var)
+            else:
+                still_pending.append((cat_frame, placeholder, rows))
+        self.pending_categories = still_pending
+
+    def build_sensor_row(self, cat_frame, sensor, var):
+        """Create the checkbox and custom label entry for one sensor"""
+        on_mousewheel = self.on_mousewheel
+
+        # Highlight active network interfaces
+        is_active = sensor.get('is_active_nic', False)
+        if is_active:
+            frame_bg = "#d4ffd4"  # Light green background
+            text_color = "#006600"  # Dark green text
+            active_marker = " ★"  # Star to mark active
+        else:
+            frame_bg = "#f0f0f0"
+            text_color = "#000000"
+            active_marker = ""
+
+        # Create sensor row frame
+        sensor_frame = tk.Frame(cat_frame, bg=frame_bg)
+        sensor_frame.pack(fill=tk.X, padx=10, pady=2)
+
+        # Checkbox with current value
+        value_text = f" - {sensor['current_value']}{sensor['unit']}" if sensor.get('current_value') is not None else ""
+        cb = tk.Checkbutton(
+            sensor_frame,
+            text=f"{sensor['display_name']} ({sensor['name']}){value_text}{active_marker}",
+            variable=var,
+            bg=frame_bg,
+            fg=text_color,
+            selectcolor="#ffffff",
+            anchor="w",
+            command=functools.partial(self.on_checkbox_toggle, sensor, var)
+        )
+        cb.pack(side=tk.TOP, fill=tk.X)
+
+        # Custom label entry (small, below checkbox)
+        label_frame = tk.Frame(sensor_frame, bg=frame_bg)
+        label_frame.pack(side=tk.TOP, fill=tk.X, padx=20)
+
+        tk.Label(label_frame, text="Label:", bg=frame_bg, fg="#666", font=("Arial", 8)).pack(side=tk.LEFT)
+        label_entry = tk.Entry(label_frame, width=15, font=("Arial", 8))
+        label_entry.pack(side=tk.LEFT, padx=5)
+
+        # Store reference to label entry and label frame
+        sensor_key = _sensor_key(sensor)
+        self.label_entries[sensor_key] = {
+            'entry': label_entry,
+            'frame': label_frame
+        }
+        if self.custom_labels.get(sensor_key):
+            label_entry.insert(0, self.custom_labels[sensor_key])
+
+        # Remember label text and update preview when it changes
+        def on_label_key(event, key=sensor_key, entry=label_entry):
+            self.custom_labels[key] = entry.get()
+            self.update_counter()
+        label_entry.bind("<KeyRelease>", on_label_key)
+
+        # Bind mousewheel to all created widgets
+        for widget in [sensor_frame, cb, label_frame, label_entry]:
+            widget.bind("<MouseWheel>", on_mousewheel)
+
+        search_text = f"{sensor['display_name']}\0{sensor['name']}".lower()
+        self.checkboxes.append((cb, sensor, var, sensor_frame))
+        self.search_texts.append(search_text)
+
+        # Rows built after a search still get its highlighting
+        match = None
+        if self._search_term is not None:
+            match = self._search_term in search_text
+            self.set_search_highlight(cb, sensor_frame, match)
+        self.search_matches.append(match)
+
     def load_existing_metrics(self, metrics):
         """Load existing metric selections when editing config"""
+        # Index the rows once: first row per wmi_identifier, and first row per
+        # source + display_name (among all rows, and among rows without a path)
+        by_identifier = {}
+        by_name = {}
+        by_name_without_id = {}
+        for index, (sensor, var) in enumerate(self.rows):
+            name_key = f"{sensor['source']}_{sensor['display_name']}"
+            by_name.setdefault(name_key, index)
+            if sensor.get('wmi_identifier'):
+                by_identifier.setdefault(sensor['wmi_identifier'], index)
+            else:
+                by_name_without_id.setdefault(name_key, index)
+
         for metric in metrics:
             # Find matching sensor and check it
-            for cb, sensor, var, frame in self.checkboxes:
+            metric_key = f"{metric['source']}_{metric['display_name']}"
+            if metric.get('wmi_identifier'):
                 # Primary match: use wmi_identifier (sensor path) - most reliable
-                if sensor.get('wmi_identifier') and metric.get('wmi_identifier'):
-                    if sensor['wmi_identifier'] == metric['wmi_identifier']:
-                        match = True
-                    else:
-                        continue
-                else:
-                    # Fallback: match by source + display_name
-                    sensor_key = f"{sensor['source']}_{sensor['display_name']}"
-                    metric_key = f"{metric['source']}_{metric['display_name']}"
-                    match = (sensor_key == metric_key)
-
-                if match:
-                    # Explicitly add to selected_metrics (duplicate check in on_checkbox_toggle prevents double-adds)
-                    if sensor not in self.selected_metrics:
-                        self.selected_metrics.append(sensor)
-
-                    # Set checkbox (this will trigger on_checkbox_toggle which handles showing label entry)
-                    var.set(True)
-
-                    # Set custom label if exists - use wmi_identifier as key
-                    label_key = sensor.get('wmi_identifier') or f"{sensor['source']}_{sensor['display_name']}"
-                    if metric.get('custom_label') and label_key in self.label_entries:
-                        self.label_entries[label_key]['entry'].insert(0, metric['custom_label'])
-                    break
+                # (sensors without one still match by source + display_name)
+                candidates = [i for i in (by_identifier.get(metric['wmi_identifier']),
+                                          by_name_without_id.get(metric_key)) if i is not None]
+                index = min(candidates) if candidates else None
+            else:
+                # Fallback: match by source + display_name
+                index = by_name.get(metric_key)
+            if index is None:
+                continue
+            sensor, var = self.rows[index]
+
+            # Explicitly add to selected_metrics (duplicate check in on_checkbox_toggle prevents double-adds)
+            label_key = _sensor_key(sensor)
+            if label_key not in self.selected_keys:
+                self.selected_keys.add(label_key)
+                self.selected_metrics.append(sensor)
+
+            # Set checkbox (this will trigger on_checkbox_toggle which handles showing label entry)
+            var.set(True)
+
+            # Set custom label if exists - use wmi_identifier as key
+            if metric.get('custom_label'):
+                self.custom_labels[label_key] = metric['custom_label']
+                if label_key in self.label_entries:
+                    self.label_entries[label_key]['entry'].insert(0, metric['custom_label'])
 
         # Force update after all metrics loaded to ensure preview refreshes
         self.root.after(100, self.update_counter)
@@ -1933,21 +2233,23 @@ class MetricSelectorGUI:
                 var.set(False)
                 return
             # Check for duplicates before appending
-            if sensor not in self.selected_metrics:
+            sensor_key = _sensor_key(sensor)
+            if sensor_key not in self.selected_keys:
+                self.selected_keys.add(sensor_key)
                 self.selected_metrics.append(sensor)
         else:
-            if sensor in self.selected_metrics:
+            sensor_key = _sensor_key(sensor)
+            if sensor_key in self.selected_keys:
+                self.selected_keys.discard(sensor_key)
                 self.selected_metrics.remove(sensor)
 
         self.update_counter()
 
     def get_display_label_for_metric(self, sensor):
         """Get custom label if set, otherwise return sensor name"""
-        sensor_key = sensor.get('wmi_identifier') or f"{sensor['source']}_{sensor['display_name']}"
-        if sensor_key in self.label_entries:
-            custom = self.label_entries[sensor_key]['entry'].get().strip()
-            if custom:
-                return custom[:10]  # Enforce 10 char limit
+        custom = self.custom_labels.get(_sensor_key(sensor), "").strip()
+        if custom:
+            return custom[:10]  # Enforce 10 char limit
         return sensor['name']
 
     def update_counter(self):
@@ -1964,50 +2266,59 @@ class MetricSelectorGUI:
         self.preview_text.config(text=preview if preview else "(none selected)")
 
     def clear_all(self):
-        for cb, sensor, var, frame in self.checkboxes:
+        for sensor, var in self.rows:
             var.set(False)
         self.selected_metrics.clear()
+        self.selected_keys.clear()
         self.update_counter()
 
+    def schedule_search(self, *args):
+        """Run on_search once typing pauses instead of on every keystroke"""
+        if self._search_after is not None:
+            self.root.after_cancel(self._search_after)
+        self._search_after = self.root.after(120, self.on_search)
+
     def on_search(self, *args):
-        search_term = self.search_var.get().lower()
-        for cb, sensor, var, frame in self.checkboxes:
-            if search_term in sensor['display_name'].lower() or search_term in sensor['name'].lower():
-                cb.config(bg="#ffffcc")
-                frame.config(bg="#ffffcc")
-            else:
-                cb.config(bg="#f0f0f0")
-                frame.config(bg="#f0f0f0")
+        self._search_after = None
+        self._search_term = search_term = self.search_var.get().lower()
+        search_matches = self.search_matches
+        for i, ((cb, sensor, var, frame), search_text) in enumerate(zip(self.checkboxes, self.search_texts)):
+            # Only restyle rows whose highlight actually changes
+            match = search_term in search_text
+            if match is not search_matches[i]:
+                self.set_search_highlight(cb, frame, match)
+                search_matches[i] = match
+
+    def set_search_highlight(self, cb, frame, match):
+        if match:
+            cb.config(bg="#ffffcc")
+            frame.config(bg="#ffffcc")
+        else:
+            cb.config(bg="#f0f0f0")
+            frame.config(bg="#f0f0f0")
 
-    def get_autostart_status_text(self):
-        """Check if autostart is enabled"""
+    def get_autostart_state(self):
+        """Check if autostart is enabled, returns (status text, status color)"""
         try:
-            import winshell
-            startup_folder = winshell.startup()
-            shortcut_path = os.path.join(startup_folder, "PC Monitor.lnk")
-            if os.path.exists(shortcut_path):
-                return "✓ Enabled"
+            if os.path.exists(_autostart_shortcut_path()):
+                return "✓ Enabled", "#00ff00"
             else:
-                return "✗ Disabled"
+                return "✗ Disabled", "#ff6666"
         except Exception:
-            return "? Unknown"
+            return "? Unknown", "#888888"
+
+    def get_autostart_status_text(self):
+        """Check if autostart is enabled"""
+        return self.get_autostart_state()[0]
 
     def get_autostart_status_color(self):
         """Get color for autostart status"""
-        status = self.get_autostart_status_text()
-        if "Enabled" in status:
-            return "#00ff00"
-        elif "Disabled" in status:
-            return "#ff6666"
-        else:
-            return "#888888"
+        return self.get_autostart_state()[1]
 
     def update_autostart_status(self):
         """Update the autostart status label"""
-        self.autostart_status.config(
-            text=self.get_autostart_status_text(),
-            fg=self.get_autostart_status_color()
-        )
+        status_text, status_color = self.get_autostart_state()
+        self.autostart_status.config(text=status_text, fg=status_color)
 
     def enable_autostart(self):
         """Enable autostart"""
@@ -2054,29 +2365,27 @@ class MetricSelectorGUI:
             messagebox.showerror("Invalid Settings", str(e))
             return
 
+        # Assign IDs and add custom labels (one dict built per metric)
+        custom_labels = self.custom_labels
+        metrics = []
+        for i, sensor in enumerate(self.selected_metrics):
+            # Get custom label if set
+            custom_label = custom_labels.get(_sensor_key(sensor), "").strip()[:10]  # Max 10 chars
+
+            if custom_label:
+                metrics.append({**sensor, "id": i + 1, "custom_label": custom_label})
+            else:
+                metrics.append({**sensor, "id": i + 1})
+
         # Build config
         config = {
             "version": "2.1",
             "esp32_ip": esp_ip,
             "udp_port": udp_port,
             "update_interval": update_interval,
-            "metrics": []
+            "metrics": metrics
         }
 
-        # Assign IDs and add custom labels
-        for i, sensor in enumerate(self.selected_metrics):
-            metric_config = sensor.copy()
-            metric_config["id"] = i + 1
-
-            # Get custom label if set
-            sensor_key = sensor.get('wmi_identifier') or f"{sensor['source']}_{sensor['display_name']}"
-            if sensor_key in self.label_entries:
-                custom_label = self.label_entries[sensor_key]['entry'].get().strip()
-                if custom_label:
-                    metric_config["custom_label"] = custom_label[:10]  # Max 10 chars
-
-            config["metrics"].append(metric_config)
-
         if save_config(config):
             messagebox.showinfo("Success", f"Configuration saved!\n{len(self.selected_metrics)} metrics will be monitored.")
             self.root.quit()
@@ -2084,25 +2393,134 @@ class MetricSelectorGUI:
             messagebox.showerror("Error", "Failed to save configuration!")
 
 
-def get_metric_value(metric_config):
+def _discovery_worker(results):
+    """Run discover_sensors() off the Tk main thread and report completion on a queue"""
+    # Each thread needs its own COM initialization for WMI
+    if PYTHONCOM_AVAILABLE:
+        try:
+            pythoncom.CoInitialize()
+        except Exception:
+            pass
+
+    try:
+        discover_sensors()
+        results.put(None)
+    except Exception as e:
+        results.put(e)
+    finally:
+        if PYTHONCOM_AVAILABLE:
+            try:
+                pythoncom.CoUninitialize()
+            except Exception:
+                pass
+
+
+def start_configuration_gui(root, existing_config=None):
+    """
+    Show a placeholder while sensors are discovered in the background, then
+    build the MetricSelectorGUI once discovery has finished.
+    WMI/HTTP discovery can take several seconds; running it on the Tk thread
+    would leave the window frozen ("Not Responding") in the meantime.
+    Returns: the discovery thread (join it before using the sensor globals)
+    """
+    root.title("PC Monitor v2.0 - Configuration")
+    placeholder = tk.Label(
+        root,
+        text="Discovering sensors...",
+        font=("Arial", 14),
+        padx=40,
+        pady=30
+    )
+    placeholder.pack()
+
+    results = queue.Queue()
+    worker = threading.Thread(target=_discovery_worker, args=(results,), daemon=True)
+    worker.start()
+
+    def drain():
+        try:
+            error = results.get_nowait()
+        except queue.Empty:
+            root.after(100, drain)
+            return
+
+        placeholder.destroy()
+        if error is not None:
+            print(f"\n⚠ Sensor discovery failed: {error}")
+        MetricSelectorGUI(root, existing_config)
+
+    root.after(100, drain)
+    return worker
+
+
+def _get_wmi():
+    """Return this thread's LibreHardwareMonitor WMI connection, connecting on first use"""
+    conn = getattr(_wmi_local, "conn", None)
+    if conn is None:
+        import wmi
+        conn = wmi.WMI(namespace="root\\LibreHardwareMonitor")
+        _wmi_local.conn = conn
+    return conn
+
+
+def refresh_wmi_snapshot(max_age=None):
+    """
+    Read Identifier and Value of every WMI sensor at most once per max_age
+    seconds, so all metrics of one polling tick share one WMI query.
+    Returns: True if the snapshot holds data from a successful query
+    """
+    if max_age is None:
+        max_age = REST_SNAPSHOT_MAX_AGE
+
+    now = time.monotonic()
+    if _wmi_snapshot["ts"] is not None and now - _wmi_snapshot["ts"] < max_age:
+        return _wmi_snapshot["ok"]
+    _wmi_snapshot["ts"] = now
+
+    try:
+        sensors = _get_wmi().Sensor(["Identifier", "Value"])
+        _wmi_snapshot["by_id"] = {sensor.Identifier: sensor.Value for sensor in sensors}
+        _wmi_snapshot["ok"] = True
+    except Exception:
+        _wmi_local.conn = None  # Reconnect on the next query
+        _wmi_snapshot["by_id"] = {}
+        _wmi_snapshot["ok"] = False
+
+    return _wmi_snapshot["ok"]
+
+
+def get_metric_value(metric_config, cache=None):
     """
     Get current value for a configured metric
 
+    Args:
+        metric_config: Metric entry from the configuration
+        cache: Optional dict shared by the metrics of one update, so psutil
+            readings used by several metrics are only taken once
+
     Returns: int value on success, None on failure (for WMI/REST API sources)
     """
     source = metric_config["source"]
 
     if source == "psutil":
         method = metric_config["psutil_method"]
+        if cache is None:
+            cache = {}
 
         if method == "cpu_percent":
             return int(psutil.cpu_percent(interval=0))
         elif method == "virtual_memory.percent":
-            return int(psutil.virtual_memory().percent)
+            if "vm" not in cache:
+                cache["vm"] = psutil.virtual_memory()
+            return int(cache["vm"].percent)
         elif method == "virtual_memory.used":
-            return int(psutil.virtual_memory().used / (1024**3))  # GB
+            if "vm" not in cache:
+                cache["vm"] = psutil.virtual_memory()
+            return int(cache["vm"].used / (1024**3))  # GB
         elif method == "disk_usage":
-            return int(psutil.disk_usage('C:\\').percent)
+            if "disk" not in cache:
+                cache["disk"] = psutil.disk_usage('C:\\')
+            return int(cache["disk"].percent)
 
     elif source == "wmi":
         # Check if we should use REST API instead (LHM 0.9.5+ workaround)
@@ -2113,23 +2531,22 @@ def get_metric_value(metric_config):
             return get_metric_value_via_http(metric_config, rest_api_host, rest_api_port)
 
         # Use WMI for older LibreHardwareMonitor versions
+        if not refresh_wmi_snapshot():
+            return None  # WMI failed
+
+        raw_value = _wmi_snapshot["by_id"].get(metric_config.get("wmi_identifier"))
+        if raw_value is None:
+            return None  # Sensor not found
         try:
-            import wmi
-            w = wmi.WMI(namespace="root\\LibreHardwareMonitor")
-            identifier = metric_config["wmi_identifier"]
-
-            sensors = w.Sensor(Identifier=identifier)
-            if sensors:
-                value = float(sensors[0].Value)
-                # For throughput: WMI returns B/s, convert to KB/s and multiply by 10
-                # ESP32 will divide by 10 when displaying
-                if metric_config.get("unit", "") == "KB/s":
-                    value = value / 1024  # B/s → KB/s
-                    value = value * 10    # Preserve 1 decimal place
-                return int(value)
-        except:
-            pass
-        return None  # WMI failed
+            value = float(raw_value)
+            # For throughput: WMI returns B/s, convert to KB/s and multiply by 10
+            # ESP32 will divide by 10 when displaying
+            if metric_config.get("unit", "") == "KB/s":
+                value = value / 1024  # B/s → KB/s
+                value = value * 10    # Preserve 1 decimal place
+            return int(value)
+        except (TypeError, ValueError, OverflowError):
+            return None
 
     return None
 
@@ -2141,8 +2558,44 @@ STATUS_LHM_NOT_RUNNING = 3
 STATUS_LHM_STARTING = 4
 STATUS_UNKNOWN_ERROR = 5
 
+# Console status indicator per status code
+_STATUS_NAMES = {
+    STATUS_OK: "",
+    STATUS_API_ERROR: " [API ERR]",
+    STATUS_LHM_NOT_RUNNING: " [LHM DOWN]",
+    STATUS_LHM_STARTING: " [LHM STARTING]",
+    STATUS_UNKNOWN_ERROR: " [ERROR]"
+}
+
 
-def send_metrics(sock, config, last_good_values=None, status_code=STATUS_OK):
+def build_payload(config):
+    """
+    Build the reusable JSON payload skeleton for the configured metrics.
+    send_metrics() only fills in status, timestamp and values on each update.
+    """
+    metrics = []
+    for metric_config in config["metrics"]:
+        # Use custom label if set, otherwise use generated name
+        display_name = metric_config.get("custom_label", "")
+        if not display_name:
+            display_name = metric_config["name"]
+
+        metrics.append({
+            "id": metric_config["id"],
+            "name": display_name,
+            "value": 0,
+            "unit": metric_config["unit"]
+        })
+
+    return {
+        "version": "2.2",
+        "status": STATUS_OK,  # LHM health status code
+        "timestamp": "",  # Will be set based on data freshness
+        "metrics": metrics
+    }
+
+
+def send_metrics(sock, config, last_good_values=None, status_code=STATUS_OK, payload=None):
     """
     Collect metric values and send to ESP32
 
@@ -2151,6 +2604,7 @@ def send_metrics(sock, config, last_good_values=None, status_code=STATUS_OK):
         config: Configuration dictionary
         last_good_values: Dict to track last known good values per metric ID
         status_code: LHM status code (1=OK, 2=API error, 3=LHM not running, etc.)
+        payload: Skeleton from build_payload(config), reused across calls
 
     Returns:
         Tuple of (success: bool, last_good_values: dict, has_fresh_data: bool)
@@ -2162,16 +2616,12 @@ def send_metrics(sock, config, last_good_values=None, status_code=STATUS_OK):
     has_fresh_data = False
     stale_count = 0
 
-    # Build JSON payload with status code
-    payload = {
-        "version": "2.2",
-        "status": status_code,  # LHM health status code
-        "timestamp": "",  # Will be set based on data freshness
-        "metrics": []
-    }
+    if payload is None:
+        payload = build_payload(config)
 
-    for metric_config in config["metrics"]:
-        value = get_metric_value(metric_config)
+    cache = {}  # psutil readings shared by this update's metrics
+    for metric_config, metric_data in zip(config["metrics"], payload["metrics"]):
+        value = get_metric_value(metric_config, cache)
         metric_id = metric_config["id"]
 
         if value is not None:
@@ -2183,18 +2633,7 @@ def send_metrics(sock, config, last_good_values=None, status_code=STATUS_OK):
             value = last_good_values.get(metric_id, 0)
             stale_count += 1
 
-        # Use custom label if set, otherwise use generated name
-        display_name = metric_config.get("custom_label", "")
-        if not display_name:
-            display_name = metric_config["name"]
-
-        metric_data = {
-            "id": metric_id,
-            "name": display_name,
-            "value": value,
-            "unit": metric_config["unit"]
-        }
-        payload["metrics"].append(metric_data)
+        metric_data["value"] = value
 
     # Override status if data is stale (even if health monitor says OK)
     # This catches the case where API starts failing but health monitor hasn't triggered yet
@@ -2203,24 +2642,23 @@ def send_metrics(sock, config, last_good_values=None, status_code=STATUS_OK):
         # All metrics are stale - definitely an API error
         if status_code == STATUS_OK:
             status_code = STATUS_API_ERROR
-        payload["status"] = status_code
     elif stale_count > 0 and stale_count >= total_metrics * 0.5:
         # More than half metrics stale - likely API issue
         if status_code == STATUS_OK:
             status_code = STATUS_API_ERROR
-        payload["status"] = status_code
+    payload["status"] = status_code
 
     # Set timestamp only if we have fresh data
     # Empty timestamp signals ESP32 that data may be stale
     if has_fresh_data:
-        payload["timestamp"] = datetime.now().strftime('%H:%M')
+        payload["timestamp"] = time.strftime('%H:%M')
     else:
         payload["timestamp"] = ""  # Signal stale data to ESP32
 
     # Send via UDP
     try:
-        message = json.dumps(payload).encode('utf-8')
-        sock.sendto(message, (config["esp32_ip"], config["udp_port"]))
+        message = json.dumps(payload, separators=(',', ':')).encode('utf-8')
+        send_udp(sock, message, (config["esp32_ip"], config["udp_port"]))
 
         # Print status with stale indicator and status code
         timestamp = payload["timestamp"] if payload["timestamp"] else "STALE"
@@ -2231,26 +2669,66 @@ def send_metrics(sock, config, last_good_values=None, status_code=STATUS_OK):
         stale_indicator = f" [!{stale_count} stale]" if stale_count > 0 else ""
 
         # Status code indicator
-        status_names = {
-            STATUS_OK: "",
-            STATUS_API_ERROR: " [API ERR]",
-            STATUS_LHM_NOT_RUNNING: " [LHM DOWN]",
-            STATUS_LHM_STARTING: " [LHM STARTING]",
-            STATUS_UNKNOWN_ERROR: " [ERROR]"
-        }
-        status_indicator = status_names.get(status_code, f" [STATUS:{status_code}]")
+        status_indicator = _STATUS_NAMES.get(status_code, f" [STATUS:{status_code}]")
 
         print(f"[{timestamp}] {metrics_str}{stale_indicator}{status_indicator}")
 
         return True, last_good_values, has_fresh_data
+    except BlockingIOError:
+        # Send buffer full - skip this update rather than block
+        return False, last_good_values, has_fresh_data
     except Exception as e:
         print(f"Error sending data: {e}")
         return False, last_good_values, has_fresh_data
 
 
+def make_udp_socket(config):
+    """
+    Create a non-blocking UDP socket connected to the ESP32.
+    Connecting once lets each send skip the per-call address lookup
+    (send_udp re-connects if this connect fails or the route changes).
+    """
+    sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+    sock.setblocking(False)
+    try:
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, UDP_SNDBUF)
+    except OSError:
+        pass  # Tuning only - the default buffer still works
+    try:
+        sock.connect((config["esp32_ip"], config["udp_port"]))
+    except OSError as e:
+        print(f"Error connecting UDP socket: {e}")
+    return sock
+
+
+def send_udp(sock, message, addr):
+    """
+    Send one datagram on a socket from make_udp_socket().
+    If the send fails because the socket isn't connected (the connect failed,
+    e.g. at autostart before the network was up) or the route went away
+    (Wi-Fi switch, new DHCP lease), re-connect and retry once, so monitoring
+    recovers on its own. Raises OSError if the ESP32 is still unreachable.
+    """
+    try:
+        sock.send(message)
+        return
+    except BlockingIOError:
+        raise
+    except OSError:
+        pass
+
+    try:
+        sock.connect(addr)
+    except OSError:
+        # Still can't connect - address the datagram directly instead
+        sock.sendto(message, addr)
+        return
+    sock.send(message)
+
+
 def create_tray_icon():
     """Create a simple system tray icon"""
-    if not TRAY_AVAILABLE:
+    if not _ensure_tray():
         return None
 
     # Create a simple icon
@@ -2269,15 +2747,13 @@ def run_minimized(config):
     """Run monitoring loop in background with system tray icon and LHM recovery"""
     global lhm_health_monitor
 
-    if not TRAY_AVAILABLE:
+    if not _ensure_tray():
         print("\nWARNING: pystray not available, running in console mode")
         print("Install with: pip install pystray pillow")
         run_monitoring(config)
         return
 
     # Create monitoring thread
-    import threading
-
     stop_event = threading.Event()
 
     def monitoring_thread():
@@ -2290,7 +2766,8 @@ def run_minimized(config):
             except Exception:
                 pass
 
-        sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        sock = make_udp_socket(config)
+        payload = build_payload(config)
         psutil.cpu_percent(interval=1)
 
         last_good_values = {}
@@ -2319,10 +2796,11 @@ def run_minimized(config):
                             current_status = STATUS_OK
 
             # Send metrics with status code
-            success, last_good_values, has_fresh = send_metrics(sock, config, last_good_values, current_status)
+            success, last_good_values, has_fresh = send_metrics(sock, config, last_good_values, current_status, payload)
 
-            # Always use normal update interval to keep ESP32 alive
-            time.sleep(config["update_interval"])
+            # Always use normal update interval to keep ESP32 alive;
+            # wait on stop_event so Quit wakes the thread immediately
+            stop_event.wait(config["update_interval"])
 
         sock.close()
 
@@ -2374,7 +2852,8 @@ def run_monitoring(config):
     print("\nStarting monitoring... (Press Ctrl+C to stop)\n")
 
     # Create UDP socket
-    sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+    sock = make_udp_socket(config)
+    payload = build_payload(config)
 
     # Warm up psutil
     psutil.cpu_percent(interval=1)
@@ -2418,7 +2897,7 @@ def run_monitoring(config):
                             print("  ⚠ Waiting for LibreHardwareMonitor to restart...")
 
             # Send metrics with status code (will use cached values if LHM is down)
-            success, last_good_values, has_fresh = send_metrics(sock, config, last_good_values, current_status)
+            success, last_good_values, has_fresh = send_metrics(sock, config, last_good_values, current_status, payload)
 
             # Always use normal update interval to keep ESP32 alive
             time.sleep(config["update_interval"])
@@ -2483,13 +2962,15 @@ def main():
         else:
             print("\nOpening configuration editor...")
 
-        # Discover sensors
-        discover_sensors()
-
-        # Show GUI
+        # Show GUI (sensor discovery runs in a worker thread)
         root = tk.Tk()
-        app = MetricSelectorGUI(root, config if args.edit else None)
+        discovery = start_configuration_gui(root, config if args.edit else None)
         root.mainloop()
+        # The window may be closed while discovery is still running - let it
+        # finish before monitoring touches the same connection and globals
+        if discovery.is_alive():
+            print("\nWaiting for sensor discovery to finish...")
+            discovery.join()
         # Only destroy if window still exists (user might have closed it via X button)
         try:
             if root.winfo_exists():
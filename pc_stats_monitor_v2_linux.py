@@ -50,6 +50,29 @@ network_last_time = None
 # NVML handles for NVIDIA GPU (populated during sensor discovery or lazily)
 nvml_handles = {}
 
+# Open sysfs file descriptors (path -> fd), kept for the life of the process
+sysfs_fds = {}
+
+
+def _read_sysfs_int(path):
+    """
+    Read an integer sysfs attribute through a cached file descriptor.
+    One pread() per call instead of open + read + close.
+    """
+    fd = sysfs_fds.get(path)
+    if fd is None:
+        fd = os.open(path, os.O_RDONLY)
+        sysfs_fds[path] = fd
+    try:
+        buf = os.pread(fd, 32, 0)
+    except OSError:
+        # Device went away (e.g. GPU reset) - reopen on the next call
+        del sysfs_fds[path]
+        os.close(fd)
+        raise
+    nl = buf.find(b"\n")
+    return int(buf[:nl] if nl >= 0 else buf)
+
 
 def discover_sensors():
     """
@@ -1835,26 +1858,20 @@ def get_metric_value(metric_config):
             hwmon_path  = metric_config.get("hwmon_path")
 
             if metric == "gpu_busy_percent":
-                with open(os.path.join(device_path, metric)) as f:
-                    return int(f.read().strip())
+                return _read_sysfs_int(os.path.join(device_path, metric))
             elif metric == "mem_info_vram_used":
-                with open(os.path.join(device_path, metric)) as f:
-                    return int(int(f.read().strip()) / (1024 ** 2))
+                return int(_read_sysfs_int(os.path.join(device_path, metric)) / (1024 ** 2))
             elif metric == "freq1_input":
-                with open(os.path.join(hwmon_path, metric)) as f:
-                    return int(f.read().strip()) // 1_000_000
+                return _read_sysfs_int(os.path.join(hwmon_path, metric)) // 1_000_000
             elif metric == "fan1_input":
-                with open(os.path.join(hwmon_path, metric)) as f:
-                    return int(f.read().strip())
+                return _read_sysfs_int(os.path.join(hwmon_path, metric))
             elif metric in ("power1_average", "power1_input"):
-                with open(os.path.join(hwmon_path, metric)) as f:
-                    return int(int(f.read().strip()) / 1_000_000)
+                return int(_read_sysfs_int(os.path.join(hwmon_path, metric)) / 1_000_000)
             elif metric == "temp1_input":
-                with open(os.path.join(hwmon_path, metric)) as f:
-                    return int(f.read().strip()) // 1000
+                return _read_sysfs_int(os.path.join(hwmon_path, metric)) // 1000
             elif metric == "mem_percent":
-                used  = int(open(os.path.join(device_path, "mem_info_vram_used")).read().strip())
-                total = int(open(os.path.join(device_path, "mem_info_vram_total")).read().strip())
+                used  = _read_sysfs_int(os.path.join(device_path, "mem_info_vram_used"))
+                total = _read_sysfs_int(os.path.join(device_path, "mem_info_vram_total"))
                 return int(used * 100 / total) if total > 0 else 0
         except Exception:
             pass